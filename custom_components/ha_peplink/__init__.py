@@ -7,12 +7,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import DOMAIN
-from .coordinator import PeplinkCoordinator
+from .const import CONF_ENABLE_GPS, CONF_ENABLE_VPN, DOMAIN
+from .coordinator import PeplinkCoordinator, validate_options
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["binary_sensor", "button", "device_tracker", "select", "sensor"]
+PLATFORMS = ("binary_sensor", "button", "device_tracker", "select", "sensor")
+
+# Options that add/remove entities — changing any of these requires a reload
+RELOAD_OPTIONS = (CONF_ENABLE_GPS, CONF_ENABLE_VPN)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -22,6 +25,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
       1. Create coordinator
       2. Discover hardware (populates wan_connections + vpn_profiles_at_discovery)
       3. First coordinator refresh (populates coordinator.data with live values)
+         — serial with 2: the status poll filters on the discovered WAN ids
       4. Store coordinator
       5. Set up platforms (entities read wan_connections and initial data)
 
@@ -57,5 +61,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload the entry when options change."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply option changes, reloading only when the entity set is affected.
+
+    Poll interval changes are pushed into the running coordinator. Entry data
+    changes (reconfigure) are reloaded by the config flow itself.
+    """
+    coordinator: PeplinkCoordinator = hass.data[DOMAIN][entry.entry_id]
+    old_options = coordinator.options
+    new_options = validate_options(entry.options)
+    if new_options == old_options:
+        return
+
+    if any(old_options[key] != new_options[key] for key in RELOAD_OPTIONS):
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    coordinator.update_options(new_options)
+    _LOGGER.debug("Applied polling option changes without reload")
@@ -7,7 +7,6 @@ automatic re-authentication on HTTP 401 and API-level stat=fail/code=401.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 import time
@@ -15,9 +14,29 @@ from typing import Any
 
 import aiohttp
 
+try:
+    import orjson as _json   # Ships with Home Assistant; parses/serializes bytes directly
+
+    _json_dumps = _json.dumps
+except ImportError:  # pragma: no cover
+    import json as _json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json.dumps(obj).encode()
+
 from .const import (
-    AUTH_MODE_TOKEN,
     AUTH_MODE_USERPASS,
+    PATH_CELLULAR_RESET,
+    PATH_INFO_FIRMWARE,
+    PATH_INFO_LOCATION,
+    PATH_LOGIN,
+    PATH_STATUS_CLIENT,
+    PATH_STATUS_PEPVPN,
+    PATH_SYSTEM_INFO,
+    PATH_TOKEN_GRANT,
+    PATH_WAN_PRIORITY,
+    PATH_WAN_STATUS,
+    PATH_WAN_USAGE,
     TOKEN_REFRESH_SECS,
 )
 from .models import (
@@ -36,6 +55,46 @@ from .const import WAN_TYPE_CELLULAR, WAN_TYPE_ETHERNET, WAN_TYPE_WIFI, WAN_TYPE
 
 _LOGGER = logging.getLogger(__name__)
 
+# Compact API-level auth failure body: {"stat":"fail","code":401,"message":"..."}
+_AUTH_FAIL_PROBE = re.compile(rb'^\s*\{"stat":"fail","code":401[,}]')
+_AUTH_FAIL_MAX_LEN = 512
+
+# POST bodies are pre-serialized to bytes, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Session cookie in a Set-Cookie header: "bauth=VALUE; HttpOnly; SameSite=Strict"
+_SESSION_COOKIE_RE = re.compile(rb"(?:^|;)\s*(bauth|pauth)=([^;\s]+)")
+
+
+def create_session(verify_ssl: bool = True) -> aiohttp.ClientSession:
+    """Create an aiohttp session suited to talking to one Peplink router.
+
+    Cookies are managed manually (the REST and web-admin sessions both use a
+    'bauth'/'pauth' cookie and must not be mixed), so Home Assistant's shared
+    session — which has a real cookie jar — is not used.
+    """
+    # ssl=False disables cert verification; ssl=None uses the default
+    # context (verification enabled). ssl=True is NOT a valid value.
+    ssl_param: bool | None = None if verify_ssl else False
+    # Single router host: a small keep-alive pool avoids a TCP/TLS
+    # handshake per request across the endpoints hit each poll cycle.
+    # Idle sockets are recycled after 75s — longer than the default usage/diag
+    # cadences (60s/30s) so slow polls reuse a warm connection, but short
+    # enough not to outlive the router's own idle timeout and fail mid-poll.
+    connector = aiohttp.TCPConnector(
+        ssl=ssl_param,
+        limit=4,
+        limit_per_host=4,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(
+        cookie_jar=aiohttp.DummyCookieJar(),  # Manage cookies manually
+        timeout=aiohttp.ClientTimeout(connect=10, sock_read=30, sock_connect=10),
+        connector=connector,
+        skip_auto_headers=("User-Agent",),    # Router ignores it; smaller requests
+    )
+
 
 class PeplinkAuthError(Exception):
     """Authentication failed (wrong credentials or token)."""
@@ -65,6 +124,7 @@ class PeplinkApiClient:
         client_id: str = "",
         client_secret: str = "",
         verify_ssl: bool = True,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._auth_mode = auth_mode
@@ -74,17 +134,22 @@ class PeplinkApiClient:
         self._client_secret = client_secret
         self._verify_ssl = verify_ssl
 
-        self._timeout = aiohttp.ClientTimeout(connect=10, sock_read=30, sock_connect=10)
-        self._session: aiohttp.ClientSession | None = None
+        # An externally supplied session (e.g. one per config flow, shared by
+        # several short-lived clients) is used as-is and never closed here.
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
 
         # USERPASS auth state
         self._auth_cookie: str | None = None
         self._auth_cookie_name: str = "bauth"   # bauth=HTTPS, pauth=HTTP
         self._is_connected: bool = False
+        self._auth_header_cache: dict[str, str] = {}   # Rebuilt only when the cookie changes
 
         # TOKEN auth state
         self._access_token: str | None = None
         self._token_expires_at: float = 0.0   # time.monotonic() seconds
+        self._token_query: str = ""           # "accessToken=..." suffix, set per grant
+        self._url_cache: dict[str, str] = {}  # path -> full URL; reset when the token changes
 
         self._auth_lock = asyncio.Lock()
 
@@ -103,22 +168,16 @@ class PeplinkApiClient:
     def _session_obj(self) -> aiohttp.ClientSession:
         """Return (or create) the underlying aiohttp session."""
         if self._session is None or self._session.closed:
-            # ssl=False disables cert verification; ssl=None uses the default
-            # context (verification enabled). ssl=True is NOT a valid value.
-            ssl_param: bool | None = None if self._verify_ssl else False
-            connector = aiohttp.TCPConnector(ssl=ssl_param)
-            self._session = aiohttp.ClientSession(
-                cookie_jar=aiohttp.DummyCookieJar(),  # Manage cookies manually
-                timeout=self._timeout,
-                connector=connector,
-            )
+            self._session = create_session(self._verify_ssl)
+            self._owns_session = True
         return self._session
 
     async def close(self) -> None:
-        """Close the HTTP session and release resources."""
-        if self._session and not self._session.closed:
+        """Close the HTTP session (if owned) and release resources."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
         self._session = None
+        self._owns_session = True
 
     # ===== AUTH STATE =====
 
@@ -129,37 +188,69 @@ class PeplinkApiClient:
         # token mode
         return self._access_token is not None and time.monotonic() < self._token_expires_at
 
+    def _current_credential(self) -> str | None:
+        """Return the cookie or token that requests are currently sent with."""
+        if self._auth_mode == AUTH_MODE_USERPASS:
+            return self._auth_cookie
+        return self._access_token
+
     def _clear_auth_state(self) -> None:
         self._auth_cookie = None
+        self._auth_header_cache = {}
         self._is_connected = False
         self._access_token = None
         self._token_expires_at = 0.0
+        self._token_query = ""
+        self._url_cache = {}
 
     # ===== AUTHENTICATION =====
 
     async def _ensure_connected(self, force: bool = False) -> None:
-        """Ensure we have valid auth credentials. Thread-safe via lock."""
+        """Ensure we have valid auth credentials. Thread-safe via lock.
+
+        Lock-free when credentials are already valid, so concurrent requests
+        don't serialize on the happy path; re-checked under the lock otherwise.
+        """
+        if not force and self.is_authenticated():
+            return
         async with self._auth_lock:
-            if self._auth_mode == AUTH_MODE_USERPASS:
-                if self._is_connected and self._auth_cookie is not None and not force:
-                    return
-                await self._login()
-            else:
-                if self._access_token is not None and time.monotonic() < self._token_expires_at and not force:
-                    return
-                await self._grant_token()
+            if not force and self.is_authenticated():
+                return   # Another task re-authenticated while we waited
+            await self._authenticate()
+
+    async def _reauthenticate(self, rejected: str | None) -> None:
+        """Re-authenticate after a 401 on a request sent with `rejected`.
+
+        Polls run concurrently, so several requests can hit a 401 together.
+        Only the first one through the lock logs in again; the rest find a
+        different credential already in place and just retry with it.
+        """
+        async with self._auth_lock:
+            if self.is_authenticated() and self._current_credential() != rejected:
+                return
+            self._clear_auth_state()
+            await self._authenticate()
+
+    async def _authenticate(self) -> None:
+        """Log in or grant a token for the configured auth mode. Caller holds _auth_lock."""
+        if self._auth_mode == AUTH_MODE_USERPASS:
+            await self._login()
+        else:
+            await self._grant_token()
 
     async def _login(self) -> None:
         """POST /api/login, extract session cookie. Port of PeplinkApiClient.login().\n\n        Peplink sets 'bauth' over HTTPS and 'pauth' over plain HTTP.\n        Both are stored and replayed on subsequent requests.\n        """
-        url = f"{self._base_url}/api/login"
+        url = self._base_url + PATH_LOGIN
         payload = {
             "username": self._username,
             "password": self._password,
             "challenge": "challenge",   # Required by Peplink API
         }
         try:
-            async with self._session_obj().post(url, json=payload) as resp:
-                text = await resp.text()
+            async with self._session_obj().post(
+                url, data=_json_dumps(payload), headers=_JSON_HEADERS
+            ) as resp:
+                raw = await resp.read()
 
                 if resp.status == 401:
                     self._is_connected = False
@@ -170,7 +261,7 @@ class PeplinkApiClient:
                     raise PeplinkConnectionError(f"Login failed: HTTP {resp.status}")
 
                 try:
-                    body = json.loads(text)
+                    body = _json.loads(raw)
                 except ValueError as err:
                     raise PeplinkConnectionError("Login failed: non-JSON response") from err
 
@@ -181,34 +272,22 @@ class PeplinkApiClient:
                 # Extract session cookie from Set-Cookie response header.
                 # Peplink uses "bauth" over HTTPS and "pauth" over plain HTTP.
                 # Format: "bauth=VALUE; HttpOnly; SameSite=Strict"
-                session_cookie: str | None = None
-                session_cookie_name: str = "bauth"
-                for hdr in resp.headers.getall("Set-Cookie", []):
-                    for part in hdr.split(";"):
-                        part = part.strip()
-                        if part.startswith("bauth="):
-                            session_cookie = part[6:]
-                            session_cookie_name = "bauth"
-                            break
-                        if part.startswith("pauth="):
-                            session_cookie = part[6:]
-                            session_cookie_name = "pauth"
-                            break
-                    if session_cookie:
-                        break
-
-                if not session_cookie:
+                found = _find_session_cookie(resp)
+                if found is None:
                     self._is_connected = False
                     raise PeplinkAuthError("Login failed: no session cookie (bauth/pauth) in response")
 
+                session_cookie_name, session_cookie = found
                 self._auth_cookie = session_cookie
                 self._auth_cookie_name = session_cookie_name
+                self._auth_header_cache = {"Cookie": f"{session_cookie_name}={session_cookie}"}
                 self._is_connected = True
                 _LOGGER.debug("Login successful (cookie obtained)")
 
         except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             self._is_connected = False
             self._auth_cookie = None
+            self._auth_header_cache = {}
             raise PeplinkConnectionError(f"Login connection error: {err}") from err
 
     async def _grant_token(self) -> None:
@@ -216,15 +295,17 @@ class PeplinkApiClient:
         if not self._client_id or not self._client_secret:
             raise PeplinkAuthError("Token auth requires client_id and client_secret")
 
-        url = f"{self._base_url}/api/auth.token.grant"
+        url = self._base_url + PATH_TOKEN_GRANT
         payload = {
             "clientId": self._client_id,
             "clientSecret": self._client_secret,
             "scope": "api",
         }
         try:
-            async with self._session_obj().post(url, json=payload) as resp:
-                text = await resp.text()
+            async with self._session_obj().post(
+                url, data=_json_dumps(payload), headers=_JSON_HEADERS
+            ) as resp:
+                raw = await resp.read()
 
                 if resp.status == 401:
                     self._clear_auth_state()
@@ -235,7 +316,7 @@ class PeplinkApiClient:
                     raise PeplinkConnectionError(f"Token grant failed: HTTP {resp.status}")
 
                 try:
-                    body = json.loads(text)
+                    body = _json.loads(raw)
                 except ValueError as err:
                     raise PeplinkConnectionError("Token grant failed: non-JSON response") from err
 
@@ -252,6 +333,8 @@ class PeplinkApiClient:
                     raise PeplinkAuthError("Token grant failed: no accessToken in response")
 
                 self._access_token = token
+                self._token_query = f"accessToken={token}"
+                self._url_cache = {}
                 # Use hardcoded 46h (matches TOKEN_REFRESH_INTERVAL_MS in PeplinkApiClient.kt)
                 self._token_expires_at = time.monotonic() + TOKEN_REFRESH_SECS
                 _LOGGER.debug("Token grant successful (valid for ~46h)")
@@ -263,22 +346,28 @@ class PeplinkApiClient:
     # ===== REQUEST DISPATCH =====
 
     def _build_url(self, path: str) -> str:
-        """Append accessToken query param for token mode."""
-        url = f"{self._base_url}{path}"
-        if self._auth_mode == AUTH_MODE_TOKEN and self._access_token:
-            sep = "&" if "?" in url else "?"
-            url = f"{url}{sep}accessToken={self._access_token}"
+        """Append accessToken query param for token mode (empty suffix otherwise).
+
+        Poll paths repeat every cycle, so full URLs are memoized per auth cycle.
+        """
+        url = self._url_cache.get(path)
+        if url is None:
+            if self._token_query:
+                sep = "&" if "?" in path else "?"
+                url = f"{self._base_url}{path}{sep}{self._token_query}"
+            else:
+                url = self._base_url + path
+            self._url_cache[path] = url
         return url
 
     def _auth_headers(self) -> dict[str, str]:
         """Return auth headers for userpass mode (cookie injection).
 
         Peplink uses 'bauth' over HTTPS and 'pauth' over plain HTTP.
-        We store whichever was returned and inject it as-is.
+        We store whichever was returned and inject it as-is. The dict is built
+        once per login and shared; callers must not mutate it.
         """
-        if self._auth_mode == AUTH_MODE_USERPASS and self._auth_cookie:
-            return {"Cookie": f"{self._auth_cookie_name}={self._auth_cookie}"}
-        return {}
+        return self._auth_header_cache
 
     async def _request(
         self, method: str, path: str, body: dict | None = None
@@ -289,35 +378,45 @@ class PeplinkApiClient:
         Port of makeAuthenticatedRequest() in PeplinkApiClient.kt.
         """
         await self._ensure_connected()
+        payload = _json_dumps(body) if body is not None else None
 
         for _attempt in range(2):
+            credential = self._current_credential()
             url = self._build_url(path)
             headers = self._auth_headers()
             kwargs: dict = {}
-            if body is not None:
-                kwargs["json"] = body
+            if payload is not None:
+                kwargs["data"] = payload
+                headers = {**headers, **_JSON_HEADERS}
 
             try:
                 async with self._session_obj().request(
                     method, url, headers=headers, **kwargs
                 ) as resp:
-                    text = await resp.text()
+                    raw = await resp.read()
 
                     # HTTP 401 — session/token expired, re-auth once
                     if resp.status == 401:
                         _LOGGER.debug("HTTP 401, re-authenticating")
-                        self._clear_auth_state()
-                        await self._ensure_connected(force=True)
+                        await self._reauthenticate(credential)
                         continue
 
                     if not resp.ok:
                         raise PeplinkConnectionError(f"HTTP {resp.status}")
 
+                    # API-level 401 fast path: the error body is tiny, so probe the
+                    # bytes and skip parsing it (parsed check below covers spacing variants)
+                    if len(raw) <= _AUTH_FAIL_MAX_LEN and _AUTH_FAIL_PROBE.search(raw):
+                        _LOGGER.debug("API-level 401, re-authenticating")
+                        await self._reauthenticate(credential)
+                        continue
+
                     # Parse JSON response
                     try:
-                        data = json.loads(text)
+                        data = _json.loads(raw)
                     except ValueError:
-                        return text   # Non-JSON response (shouldn't happen normally)
+                        # Non-JSON response (shouldn't happen normally)
+                        return raw.decode("utf-8", errors="replace")
 
                     # API-level 401: {"stat":"fail","code":401} on HTTP 200
                     if (
@@ -326,8 +425,7 @@ class PeplinkApiClient:
                         and data.get("code") == 401
                     ):
                         _LOGGER.debug("API-level 401, re-authenticating")
-                        self._clear_auth_state()
-                        await self._ensure_connected(force=True)
+                        await self._reauthenticate(credential)
                         continue
 
                     return data
@@ -349,31 +447,23 @@ class PeplinkApiClient:
         """
         if not self._username or not self._password:
             return False
-        url = f"{self._base_url}/cgi-bin/MANGA/api.cgi?func=login"
-        cookie: str | None = None
-        name = "bauth"
+        url = f"{self._base_url}{PATH_SYSTEM_INFO}?func=login"
+        found: tuple[str, str] | None = None
         try:
             async with self._session_obj().post(
-                url, json={"username": self._username, "password": self._password}
+                url,
+                data=_json_dumps({"username": self._username, "password": self._password}),
+                headers=_JSON_HEADERS,
             ) as resp:
-                for hdr in resp.headers.getall("Set-Cookie", []):
-                    for part in hdr.split(";"):
-                        part = part.strip()
-                        if part.startswith("bauth="):
-                            cookie, name = part[6:], "bauth"
-                        elif part.startswith("pauth="):
-                            cookie, name = part[6:], "pauth"
-                    if cookie:
-                        break
+                found = _find_session_cookie(resp)
         except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.debug("Web-admin login failed: %s", err)
             self._web_cookie = None
             return False
 
-        if cookie:
-            self._web_cookie = cookie
-            self._web_cookie_name = name
-            _LOGGER.debug("Web-admin session established (cookie=%s)", name)
+        if found is not None:
+            self._web_cookie_name, self._web_cookie = found
+            _LOGGER.debug("Web-admin session established (cookie=%s)", self._web_cookie_name)
             return True
         self._web_cookie = None
         return False
@@ -403,7 +493,7 @@ class PeplinkApiClient:
                 stale = status == 401 or text.lstrip().startswith("// Unauthorized")
                 if not stale:
                     try:
-                        parsed = json.loads(text)
+                        parsed = _json.loads(text)
                     except ValueError:
                         return text   # non-JSON, e.g. the JS vars blob
                     if (
@@ -430,9 +520,7 @@ class PeplinkApiClient:
         Port of getWanStatus(). When conn_ids is provided, request includes
         ?id={space-separated ids}; otherwise the API default set is returned.
         """
-        path = "/api/status.wan.connection"
-        if conn_ids:
-            path = f"{path}?id={conn_ids}"
+        path = f"{PATH_WAN_STATUS}?id={conn_ids}" if conn_ids else PATH_WAN_STATUS
         data = await self._request("GET", path)
 
         if data.get("stat") != "ok":
@@ -449,7 +537,7 @@ class PeplinkApiClient:
 
     async def get_wan_usage(self) -> dict[int, WanUsage]:
         """GET /api/status.wan.connection.allowance  Port of getWanUsage()."""
-        data = await self._request("GET", "/api/status.wan.connection.allowance")
+        data = await self._request("GET", PATH_WAN_USAGE)
 
         if data.get("stat") != "ok":
             raise PeplinkApiError(f"WAN usage error: {data.get('message')}")
@@ -476,8 +564,10 @@ class PeplinkApiClient:
             item["enable"] = False
 
         payload = {"instantActive": True, "list": [item]}
-        data = await self._request("POST", "/api/config.wan.connection.priority", body=payload)
+        data = await self._request("POST", PATH_WAN_PRIORITY, body=payload)
 
+        if not isinstance(data, dict):
+            raise PeplinkApiError("Set priority error: non-JSON response")
         if data.get("stat") != "ok":
             raise PeplinkApiError(f"Set priority error: {data.get('message')}")
 
@@ -487,8 +577,10 @@ class PeplinkApiClient:
         Note: connId is sent as a STRING per the Kotlin source.
         """
         payload = {"connId": str(conn_id)}
-        data = await self._request("POST", "/api/cmd.cellularModule.reset", body=payload)
+        data = await self._request("POST", PATH_CELLULAR_RESET, body=payload)
 
+        if not isinstance(data, dict):
+            raise PeplinkApiError("Modem reset error: non-JSON response")
         if data.get("stat") != "ok":
             raise PeplinkApiError(f"Modem reset error: {data.get('message')}")
 
@@ -498,17 +590,20 @@ class PeplinkApiClient:
         Returns the version string for the firmware entry with inUse=true,
         or falls back to entry "1".
         """
-        data = await self._request("GET", "/api/info.firmware")
+        data = await self._request("GET", PATH_INFO_FIRMWARE)
 
         if data.get("stat") != "ok":
             raise PeplinkApiError(f"Firmware info error: {data.get('message')}")
 
         response = data.get("response", {})
-        version: str | None = None
-        for _key, entry in response.items():
-            if isinstance(entry, dict) and entry.get("inUse", False):
-                version = entry.get("version")
-                break
+        version: str | None = next(
+            (
+                entry.get("version")
+                for entry in response.values()
+                if isinstance(entry, dict) and entry.get("inUse")
+            ),
+            None,
+        )
         if not version:
             first = response.get("1", {})
             version = first.get("version") if isinstance(first, dict) else None
@@ -517,7 +612,7 @@ class PeplinkApiClient:
 
     async def get_connected_devices_count(self) -> int:
         """GET /api/status.client  Port of getConnectedDevicesCount()."""
-        data = await self._request("GET", "/api/status.client")
+        data = await self._request("GET", PATH_STATUS_CLIENT)
 
         if data.get("stat") != "ok":
             raise PeplinkApiError(f"Client status error: {data.get('message')}")
@@ -531,7 +626,7 @@ class PeplinkApiClient:
 
         Returns {profile_id: (name, type, status)}.
         """
-        data = await self._request("GET", "/api/status.pepvpn")
+        data = await self._request("GET", PATH_STATUS_PEPVPN)
 
         if data.get("stat") != "ok":
             raise PeplinkApiError(f"PepVPN status error: {data.get('message')}")
@@ -550,83 +645,31 @@ class PeplinkApiClient:
 
         return result
 
-    async def get_system_diagnostics(self) -> SystemDiagnostics:
-        """GET /cgi-bin/MANGA/api.cgi?func=status.system.info&infoType=thermalSensor+fanSpeed.
+    async def get_system_info(self) -> tuple[SystemDiagnostics, DeviceInfo]:
+        """GET /cgi-bin/MANGA/api.cgi?func=status.system.info&infoType=thermalSensor+fanSpeed+device.
 
-        Port of getSystemDiagnostics(). Returns partial data on error (not None)
-        to match the Kotlin behaviour of returning an empty SystemDiagnostics on failure.
+        Port of getSystemDiagnostics() + getDeviceInfo(), fetched in one request
+        (status.system.info accepts several space-separated infoTypes). Returns
+        partial data on error (not None) to match the Kotlin behaviour of
+        returning empty results on failure.
         """
-        path = "/cgi-bin/MANGA/api.cgi?func=status.system.info&infoType=thermalSensor%20fanSpeed"
-        try:
-            data = await self._manga_get(path)
-        except PeplinkConnectionError:
-            return SystemDiagnostics(temperature=None, temperature_threshold=None)
-
-        if not isinstance(data, dict) or data.get("stat") != "ok":
-            return SystemDiagnostics(temperature=None, temperature_threshold=None)
-
-        resp = data.get("response") or data
-
-        temperature: float | None = None
-        temperature_threshold: float | None = None
-        thermal_array = resp.get("thermalSensor", [])
-        if isinstance(thermal_array, list) and thermal_array:
-            obj = thermal_array[0]
-            if isinstance(obj, dict):
-                t = obj.get("temperature")
-                temperature = float(t) if t is not None else None
-                thr = obj.get("threshold")
-                temperature_threshold = float(thr) if thr is not None else None
-
-        fans: list[FanInfo] = []
-        fan_array = resp.get("fanSpeed", [])
-        if isinstance(fan_array, list):
-            for i, fan_obj in enumerate(fan_array):
-                if not isinstance(fan_obj, dict):
-                    continue
-                speed_rpm_raw = fan_obj.get("value")
-                speed_rpm = int(speed_rpm_raw) if speed_rpm_raw and int(speed_rpm_raw) > 0 else None
-                speed_pct_raw = fan_obj.get("percentage")
-                speed_pct = int(speed_pct_raw) if speed_pct_raw and int(speed_pct_raw) > 0 else None
-                active = bool(fan_obj.get("active", False))
-                fans.append(FanInfo(
-                    fan_id=i + 1,
-                    name=f"Fan {i + 1}",
-                    speed_rpm=speed_rpm,
-                    speed_percent=speed_pct,
-                    status="normal" if active else "off",
-                ))
-
-        return SystemDiagnostics(
-            temperature=temperature,
-            temperature_threshold=temperature_threshold,
-            fans=fans,
+        empty = (
+            SystemDiagnostics(temperature=None, temperature_threshold=None),
+            DeviceInfo(serial_number="unknown", model="unknown"),
         )
-
-    async def get_device_info(self) -> DeviceInfo:
-        """GET /cgi-bin/MANGA/api.cgi?func=status.system.info&infoType=device.
-
-        Port of getDeviceInfo(). Returns partial data on error.
-        """
-        path = "/cgi-bin/MANGA/api.cgi?func=status.system.info&infoType=device"
+        path = f"{PATH_SYSTEM_INFO}?func=status.system.info&infoType=thermalSensor%20fanSpeed%20device"
         try:
             data = await self._manga_get(path)
         except PeplinkConnectionError:
-            return DeviceInfo(serial_number="unknown", model="unknown")
+            return empty
 
         if not isinstance(data, dict) or data.get("stat") != "ok":
-            return DeviceInfo(serial_number="unknown", model="unknown")
+            return empty
 
         resp = data.get("response") or data
-        device_obj = resp.get("device") if isinstance(resp, dict) else None
-        if not isinstance(device_obj, dict):
-            return DeviceInfo(serial_number="unknown", model="unknown")
-
-        return DeviceInfo(
-            serial_number=device_obj.get("serialNumber", "unknown"),
-            model=device_obj.get("model", "unknown"),
-            hardware_version=device_obj.get("hardwareRevision") or device_obj.get("hardwareVersion"),
-        )
+        if not isinstance(resp, dict):
+            return empty
+        return _parse_system_diagnostics(resp), _parse_device_info(resp)
 
     async def get_sfc_quota(self) -> SfcQuota:
         """Fetch SpeedFusion Connect data allowance from the web-admin vars blob.
@@ -669,9 +712,9 @@ class PeplinkApiClient:
         """GET /cgi-bin/MANGA/api.cgi?func=status.traffic  Port of getTrafficStats().
 
         Returns {connId: (download_mbps, upload_mbps)}.
-        Source: kbps values from API converted to Mbps (÷1000).
+        Source: kbps values from API converted to Mbps (÷1000), rounded to 0.1 Mbps.
         """
-        path = "/cgi-bin/MANGA/api.cgi?func=status.traffic"
+        path = f"{PATH_SYSTEM_INFO}?func=status.traffic"
         try:
             data = await self._request("GET", path)
         except (PeplinkConnectionError, PeplinkApiError):
@@ -697,8 +740,8 @@ class PeplinkApiClient:
             if not isinstance(overall, dict):
                 continue
             # API returns kbps, plugin converts to Mbps by dividing by 1000
-            dl_mbps = (overall.get("download") or 0) / 1000.0
-            ul_mbps = (overall.get("upload") or 0) / 1000.0
+            dl_mbps = round((overall.get("download") or 0) / 1000.0, 1)
+            ul_mbps = round((overall.get("upload") or 0) / 1000.0, 1)
             result[conn_id] = (dl_mbps, ul_mbps)
 
         return result
@@ -709,7 +752,7 @@ class PeplinkApiClient:
         Returns None if GPS is unavailable or has no fix (not an error).
         """
         try:
-            data = await self._request("GET", "/api/info.location")
+            data = await self._request("GET", PATH_INFO_LOCATION)
         except (PeplinkConnectionError, PeplinkApiError):
             return None
 
@@ -769,8 +812,31 @@ class PeplinkApiClient:
 
 # ===== PARSING HELPERS =====
 
+def _find_session_cookie(resp: aiohttp.ClientResponse) -> tuple[str, str] | None:
+    """Return (name, value) of the first bauth/pauth cookie set by the response.
+
+    Scans the raw header tuples directly: no CIMultiDict lookup or list copy,
+    and stops at the first hit.
+    """
+    for name, value in resp.raw_headers:
+        if name.lower() == b"set-cookie":
+            m = _SESSION_COOKIE_RE.search(value)
+            if m:
+                return m.group(1).decode(), m.group(2).decode("latin-1")
+    return None
+
+
 def _to_int(value: Any) -> int | None:
-    """Convert a string or int to int, returning None on failure."""
+    """Convert a string or int to int, returning None on failure.
+
+    Plain ints, None and digit strings (the common cases) skip the try/except.
+    """
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -792,22 +858,85 @@ def _parse_conn_id_key(value: Any) -> int | None:
     return int(match.group(0)) if match else None
 
 
+def _parse_system_diagnostics(resp: dict) -> SystemDiagnostics:
+    """Thermal + fan part of a status.system.info response. Port of getSystemDiagnostics()."""
+    temperature: float | None = None
+    temperature_threshold: float | None = None
+    thermal_array = resp.get("thermalSensor", [])
+    if isinstance(thermal_array, list) and thermal_array:
+        obj = thermal_array[0]
+        if isinstance(obj, dict):
+            # Rounded here, once per diag poll, to the precision the sensors show
+            t = obj.get("temperature")
+            temperature = round(float(t), 1) if t is not None else None
+            thr = obj.get("threshold")
+            temperature_threshold = round(float(thr), 0) if thr is not None else None
+
+    fans: list[FanInfo] = []
+    fan_array = resp.get("fanSpeed", [])
+    if isinstance(fan_array, list):
+        for i, fan_obj in enumerate(fan_array):
+            if not isinstance(fan_obj, dict):
+                continue
+            # Parse each reading once; zero/missing means "not reported"
+            speed_rpm = _to_int(fan_obj.get("value"))
+            if speed_rpm is not None and speed_rpm <= 0:
+                speed_rpm = None
+            speed_pct = _to_int(fan_obj.get("percentage"))
+            if speed_pct is not None and speed_pct <= 0:
+                speed_pct = None
+            active = fan_obj.get("active") is True
+            fans.append(FanInfo(
+                fan_id=i + 1,
+                name=f"Fan {i + 1}",
+                speed_rpm=speed_rpm,
+                speed_percent=speed_pct,
+                status="normal" if active else "off",
+            ))
+
+    return SystemDiagnostics(
+        temperature=temperature,
+        temperature_threshold=temperature_threshold,
+        fans=fans,
+    )
+
+
+def _parse_device_info(resp: dict) -> DeviceInfo:
+    """Device part of a status.system.info response. Port of getDeviceInfo()."""
+    device_obj = resp.get("device")
+    if not isinstance(device_obj, dict):
+        return DeviceInfo(serial_number="unknown", model="unknown")
+
+    return DeviceInfo(
+        serial_number=device_obj.get("serialNumber", "unknown"),
+        model=device_obj.get("model", "unknown"),
+        hardware_version=device_obj.get("hardwareRevision") or device_obj.get("hardwareVersion"),
+    )
+
+
 def _parse_wan_connection(conn_id: int, data: dict) -> WanConnection:
     """Parse a single WAN connection from the API response dict.
 
-    Port of WanConnection.fromJson() in PeplinkModels.kt.
+    Port of WanConnection.fromJson() in PeplinkModels.kt. The WAN type is
+    classified in the same pass that picks out the cellular/wifi sub-objects.
     """
-    wan_type = _determine_wan_type(data)
-    enabled = bool(data.get("enable", False))
+    enabled = data.get("enable") is True
     message = data.get("message") or data.get("status")
 
     cellular: CellularInfo | None = None
-    if wan_type == WAN_TYPE_CELLULAR and isinstance(data.get("cellular"), dict):
-        cellular = _parse_cellular_info(data["cellular"])
-
     wifi: WifiInfo | None = None
-    if wan_type == WAN_TYPE_WIFI and isinstance(data.get("wifi"), dict):
-        wifi = _parse_wifi_info(data["wifi"])
+    if "cellular" in data:
+        wan_type = WAN_TYPE_CELLULAR
+        cell_data = data["cellular"]
+        if isinstance(cell_data, dict):
+            cellular = _parse_cellular_info(cell_data)
+    elif "wifi" in data:
+        wan_type = WAN_TYPE_WIFI
+        wifi_data = data["wifi"]
+        if isinstance(wifi_data, dict):
+            wifi = _parse_wifi_info(wifi_data)
+    else:
+        wan_type = _wan_type_from_name(data.get("name"))
 
     return WanConnection(
         conn_id=conn_id,
@@ -824,13 +953,9 @@ def _parse_wan_connection(conn_id: int, data: dict) -> WanConnection:
     )
 
 
-def _determine_wan_type(data: dict) -> str:
-    """Port of WanConnection.determineWanType()."""
-    if "cellular" in data:
-        return WAN_TYPE_CELLULAR
-    if "wifi" in data:
-        return WAN_TYPE_WIFI
-    name = (data.get("name") or "").lower()
+def _wan_type_from_name(name: str | None) -> str:
+    """Name-based tail of WanConnection.determineWanType() (no cellular/wifi object)."""
+    name = (name or "").lower()
     if "vwan" in name:
         return WAN_TYPE_VWAN
     if "ethernet" in name:
@@ -911,27 +1036,40 @@ def _parse_wifi_info(data: dict) -> WifiInfo:
 def _parse_wan_usage(conn_id: int, data: dict) -> WanUsage:
     """Port of WanUsage.fromJson().
 
-    Detects multi-SIM structure by checking for nested integer keys.
+    Detects multi-SIM structure by checking for nested integer keys, collecting
+    the slots in the same pass. Flat usage fields only apply without slots.
     """
-    has_nested_sims = any(_to_int(k) is not None for k in data)
-
     sim_slots: dict[int, SimSlotInfo] | None = None
-    if has_nested_sims:
-        sim_slots = {}
-        for key, slot_data in data.items():
-            slot_id = _to_int(key)
-            if slot_id is not None and isinstance(slot_data, dict):
-                sim_slots[slot_id] = _parse_sim_slot(slot_id, slot_data)
+    for key, slot_data in data.items():
+        if not key.isdecimal():
+            continue
+        if sim_slots is None:
+            sim_slots = {}
+        if isinstance(slot_data, dict):
+            slot_id = int(key)
+            sim_slots[slot_id] = _parse_sim_slot(slot_id, slot_data)
+
+    enabled = data.get("enable") is True
+    if sim_slots is not None:
+        return WanUsage(
+            conn_id=conn_id,
+            enabled=enabled,
+            usage_mb=None,
+            limit_mb=None,
+            percent=None,
+            unit=None,
+            start_date=None,
+            sim_slots=sim_slots,
+        )
 
     return WanUsage(
         conn_id=conn_id,
-        enabled=bool(data.get("enable", False)),
-        usage_mb=_to_int(data.get("usage")) if not has_nested_sims and "usage" in data else None,
-        limit_mb=_to_int(data.get("limit")) if not has_nested_sims and "limit" in data else None,
-        percent=_to_int(data.get("percent")) if not has_nested_sims and "percent" in data else None,
-        unit=data.get("unit") if not has_nested_sims else None,
-        start_date=data.get("start") if not has_nested_sims else None,
-        sim_slots=sim_slots,
+        enabled=enabled,
+        usage_mb=_to_int(data.get("usage")) if "usage" in data else None,
+        limit_mb=_to_int(data.get("limit")) if "limit" in data else None,
+        percent=_to_int(data.get("percent")) if "percent" in data else None,
+        unit=data.get("unit"),
+        start_date=data.get("start"),
     )
 
 
@@ -939,7 +1077,7 @@ def _parse_sim_slot(slot_id: int, data: dict) -> SimSlotInfo:
     """Port of SimSlotInfo.fromJson()."""
     return SimSlotInfo(
         slot_id=slot_id,
-        enabled=bool(data.get("enable", False)),
+        enabled=data.get("enable") is True,
         has_usage_tracking="usage" in data,
         usage_mb=_to_int(data.get("usage")) if "usage" in data else None,
         limit_mb=_to_int(data.get("limit")) if "limit" in data else None,
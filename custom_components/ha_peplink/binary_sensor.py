@@ -22,19 +22,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up binary sensor entities."""
     coordinator: PeplinkCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[BinarySensorEntity] = []
-
     # Per-WAN: carrier aggregation (cellular only)
-    for conn_id, wan in coordinator.wan_connections.items():
-        if wan.wan_type == WAN_TYPE_CELLULAR:
-            entities.append(CarrierAggregationSensor(coordinator, entry, conn_id))
+    entities: list[BinarySensorEntity] = [
+        CarrierAggregationSensor(coordinator, entry, conn_id)
+        for conn_id in coordinator.wan_by_type.get(WAN_TYPE_CELLULAR, ())
+    ]
 
     # Global diagnostic binary sensors
-    entities += [
+    entities.extend((
         ApiConnectedSensor(coordinator, entry),
         AuthenticatedSensor(coordinator, entry),
         DataHealthySensor(coordinator, entry),
-    ]
+    ))
 
     # SpeedFusion Connect (only when an SFC profile is active)
     sfc = coordinator.data.sfc if coordinator.data is not None else None
@@ -47,17 +46,10 @@ async def async_setup_entry(
 class CarrierAggregationSensor(PeplinkWanEntity, BinarySensorEntity):
     """Carrier aggregation active. Name: '{wan.name} Carrier Aggregation'."""
 
+    _SUFFIX = "carrier_aggregation"
+    _NAME_SUFFIX = "Carrier Aggregation"
     _attr_icon = "mdi:signal-variant"
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_carrier_aggregation"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Carrier Aggregation" if wan else f"WAN {self._conn_id} Carrier Aggregation"
-
     @property
     def is_on(self) -> bool | None:
         wan = self._wan
@@ -79,9 +71,10 @@ class ApiConnectedSensor(PeplinkEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.api_connected
+        return data.api_connected
 
 
 class AuthenticatedSensor(PeplinkEntity, BinarySensorEntity):
@@ -97,9 +90,10 @@ class AuthenticatedSensor(PeplinkEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.authenticated
+        return data.authenticated
 
 
 class SfcLicenseValidSensor(PeplinkEntity, BinarySensorEntity):
@@ -134,6 +128,7 @@ class DataHealthySensor(PeplinkEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.data_healthy
+        return data.data_healthy
@@ -26,12 +26,11 @@ async def async_setup_entry(
 ) -> None:
     """Set up button entities."""
     coordinator: PeplinkCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[ButtonEntity] = []
-
     # Per-WAN: cellular modem reset
-    for conn_id, wan in coordinator.wan_connections.items():
-        if wan.wan_type == WAN_TYPE_CELLULAR:
-            entities.append(ResetModemButton(coordinator, entry, conn_id))
+    entities: list[ButtonEntity] = [
+        ResetModemButton(coordinator, entry, conn_id)
+        for conn_id in coordinator.wan_by_type.get(WAN_TYPE_CELLULAR, ())
+    ]
 
     # Global: rediscover hardware
     entities.append(RediscoverButton(coordinator, entry))
@@ -46,22 +45,16 @@ class ResetModemButton(PeplinkWanEntity, ButtonEntity):
     next scheduled poll will reflect the new state.
     """
 
+    _SUFFIX = "reset_modem"
+    _NAME_SUFFIX = "Reset Modem"
     _attr_icon = "mdi:restart"
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_reset_modem"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Reset Modem" if wan else f"WAN {self._conn_id} Reset Modem"
-
     async def async_press(self) -> None:
         """Send modem reset command to router. Port of handleCommand(reset) in PeplinkPlugin.kt."""
         try:
             await self.coordinator.api.reset_cellular_modem(self._conn_id)
         except Exception as err:
+            _LOGGER.exception("Failed to reset modem for WAN %d", self._conn_id)
             raise HomeAssistantError(
                 f"Failed to reset modem for WAN {self._conn_id}: {err}"
             ) from err
@@ -74,7 +67,9 @@ class RediscoverButton(PeplinkEntity, ButtonEntity):
 
     Name: 'Rediscover Hardware'.
     Port of discoverHardware() triggered manually via PeplinkDiscovery in the plugin.
-    Reload is required so that new/removed WAN entities are added/removed.
+    Reload is required so that new/removed WAN entities are added/removed; it is
+    skipped when nothing entity setup depends on (WANs, VPN profiles, SFC
+    profile) differs from what the platforms were set up with.
     """
 
     _attr_name = "Rediscover Hardware"
@@ -83,12 +78,37 @@ class RediscoverButton(PeplinkEntity, ButtonEntity):
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_rediscover_hardware"
+        # Created alongside the other entities, so this is what they were built from;
+        # every reload recreates the button and retakes it.
+        self._setup_topology = self._topology()
 
     async def async_press(self) -> None:
-        """Re-discover WAN hardware then reload the config entry."""
+        """Re-discover WAN hardware, reloading the config entry only if it changed."""
         try:
             await self.coordinator.async_discover_hardware()
         except Exception as err:
+            _LOGGER.exception("Hardware rediscovery failed")
             raise HomeAssistantError(f"Hardware rediscovery failed: {err}") from err
-        # Reload entry so entity platform re-runs async_setup_entry with new wan_connections
-        await self.hass.config_entries.async_reload(self._entry.entry_id)
+        if self._topology() == self._setup_topology:
+            _LOGGER.info("Hardware rediscovery found no changes; skipping reload")
+            return
+        # Reload entry so entity platform re-runs async_setup_entry with new wan_connections.
+        # Scheduled (not awaited): cancels any pending setup retry and runs one reload.
+        self.hass.config_entries.async_schedule_reload(self._entry.entry_id)
+
+    def _topology(self) -> tuple[frozenset, frozenset, bool]:
+        """Snapshot of what entity creation depends on.
+
+        WAN ids/types/names, VPN profile ids/names, and whether an SFC profile is active.
+        """
+        coordinator = self.coordinator
+        wans = frozenset(
+            (conn_id, wan.wan_type, wan.name)
+            for conn_id, wan in coordinator.wan_connections.items()
+        )
+        vpns = frozenset(
+            (profile_id, profile.name)
+            for profile_id, profile in coordinator.vpn_profiles_at_discovery.items()
+        )
+        sfc = coordinator.data.sfc if coordinator.data is not None else None
+        return wans, vpns, sfc is not None and sfc.has_profile
@@ -12,13 +12,14 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .api import PeplinkApiClient, PeplinkAuthError, PeplinkConnectionError
+from .api import PeplinkApiClient, PeplinkAuthError, PeplinkConnectionError, create_session
 from .const import (
     AUTH_MODE_TOKEN,
     AUTH_MODE_USERPASS,
@@ -37,15 +38,11 @@ from .const import (
     CONF_USERNAME,
     CONF_VERIFY_SSL,
     CONF_VPN_INTERVAL,
-    DEFAULT_DIAG_INTERVAL,
-    DEFAULT_GPS_INTERVAL,
-    DEFAULT_STATUS_INTERVAL,
-    DEFAULT_USAGE_INTERVAL,
-    DEFAULT_VPN_INTERVAL,
     DOMAIN,
     MAX_INTERVAL,
     MIN_INTERVAL,
 )
+from .coordinator import validate_options
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +84,43 @@ class PeplinkConfigFlow(ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         self._connection_data: dict[str, Any] = {}
+        # One HTTP session per flow: the reachability check and credential
+        # tests reuse its keep-alive connection instead of re-handshaking.
+        self._session: aiohttp.ClientSession | None = None
+        self._session_verify_ssl: bool | None = None
+
+    async def _async_flow_session(self, verify_ssl: bool) -> aiohttp.ClientSession:
+        """Return this flow's session, recreating it if verify_ssl changed."""
+        if self._session is not None and (
+            self._session.closed or self._session_verify_ssl != verify_ssl
+        ):
+            await self._session.close()
+            self._session = None
+        if self._session is None:
+            self._session = create_session(verify_ssl)
+            self._session_verify_ssl = verify_ssl
+        return self._session
+
+    async def _async_check_reachable(self, base_url: str, verify_ssl: bool) -> None:
+        """Probe base_url with HEAD (no body transfer); raise if nothing answers.
+
+        Some embedded web servers reject HEAD, so 405/501 falls back to GET.
+        Any HTTP response counts as reachable — the body is never read.
+        """
+        session = await self._async_flow_session(verify_ssl)
+        timeout = aiohttp.ClientTimeout(connect=5)
+        async with session.head(base_url, timeout=timeout, allow_redirects=True) as resp:
+            if resp.status not in (405, 501):
+                return
+        async with session.get(base_url, timeout=timeout) as resp:
+            _ = resp.status   # Just checking reachability
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the flow's session when the flow finishes or is aborted."""
+        if self._session is not None and not self._session.closed:
+            self.hass.async_create_task(self._session.close())
+        self._session = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -100,13 +134,7 @@ class PeplinkConfigFlow(ConfigFlow, domain=DOMAIN):
 
             # Quick reachability check before asking for credentials
             try:
-                import aiohttp
-                timeout = aiohttp.ClientTimeout(connect=5)
-                ssl_param: bool | None = None if user_input[CONF_VERIFY_SSL] else False
-                conn = aiohttp.TCPConnector(ssl=ssl_param)
-                async with aiohttp.ClientSession(timeout=timeout, connector=conn) as sess:
-                    async with sess.get(base_url) as resp:
-                        _ = resp.status   # Just checking reachability
+                await self._async_check_reachable(base_url, user_input[CONF_VERIFY_SSL])
             except Exception as exc:  # noqa: BLE001
                 _LOGGER.debug("Reachability check failed for %s: %s", base_url, exc)
                 errors["base"] = "cannot_connect"
@@ -136,6 +164,7 @@ class PeplinkConfigFlow(ConfigFlow, domain=DOMAIN):
                 username=user_input[CONF_USERNAME],
                 password=user_input[CONF_PASSWORD],
                 verify_ssl=self._connection_data[CONF_VERIFY_SSL],
+                session=self._session,
             )
             try:
                 await client.test_connection()
@@ -150,19 +179,11 @@ class PeplinkConfigFlow(ConfigFlow, domain=DOMAIN):
                 await client.close()
 
             if not errors:
-                entry_data = {
-                    **self._connection_data,
-                    CONF_USERNAME: user_input[CONF_USERNAME],
-                    CONF_PASSWORD: user_input[CONF_PASSWORD],
-                }
-                instance_name = self._connection_data[CONF_INSTANCE_NAME]
-                await self.async_set_unique_id(
-                    f"{DOMAIN}_{instance_name.lower().replace(' ', '_')}"
-                )
-                self._abort_if_unique_id_configured()
-                return self.async_create_entry(
-                    title=f"Peplink Router ({instance_name})",
-                    data=entry_data,
+                return await self._async_finalize(
+                    {
+                        CONF_USERNAME: user_input[CONF_USERNAME],
+                        CONF_PASSWORD: user_input[CONF_PASSWORD],
+                    }
                 )
 
         return self.async_show_form(
@@ -184,6 +205,7 @@ class PeplinkConfigFlow(ConfigFlow, domain=DOMAIN):
                 client_id=user_input[CONF_CLIENT_ID],
                 client_secret=user_input[CONF_CLIENT_SECRET],
                 verify_ssl=self._connection_data[CONF_VERIFY_SSL],
+                session=self._session,
             )
             try:
                 await client.test_connection()
@@ -198,24 +220,15 @@ class PeplinkConfigFlow(ConfigFlow, domain=DOMAIN):
                 await client.close()
 
             if not errors:
-                entry_data = {
-                    **self._connection_data,
+                creds = {
                     CONF_CLIENT_ID: user_input[CONF_CLIENT_ID],
                     CONF_CLIENT_SECRET: user_input[CONF_CLIENT_SECRET],
                 }
                 # Optional admin creds for the web-admin (SFC / diagnostics) session.
                 if user_input.get(CONF_USERNAME):
-                    entry_data[CONF_USERNAME] = user_input[CONF_USERNAME]
-                    entry_data[CONF_PASSWORD] = user_input.get(CONF_PASSWORD, "")
-                instance_name = self._connection_data[CONF_INSTANCE_NAME]
-                await self.async_set_unique_id(
-                    f"{DOMAIN}_{instance_name.lower().replace(' ', '_')}"
-                )
-                self._abort_if_unique_id_configured()
-                return self.async_create_entry(
-                    title=f"Peplink Router ({instance_name})",
-                    data=entry_data,
-                )
+                    creds[CONF_USERNAME] = user_input[CONF_USERNAME]
+                    creds[CONF_PASSWORD] = user_input.get(CONF_PASSWORD, "")
+                return await self._async_finalize(creds)
 
         return self.async_show_form(
             step_id="token",
@@ -223,6 +236,18 @@ class PeplinkConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def _async_finalize(self, creds: dict[str, Any]) -> FlowResult:
+        """Create the entry from the step 1 connection data plus validated credentials."""
+        instance_name = self._connection_data[CONF_INSTANCE_NAME]
+        await self.async_set_unique_id(
+            f"{DOMAIN}_{instance_name.lower().replace(' ', '_')}"
+        )
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=f"Peplink Router ({instance_name})",
+            data={**self._connection_data, **creds},
+        )
+
     async def async_step_reconfigure(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -299,7 +324,7 @@ class PeplinkOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Show options form."""
-        opts = self._config_entry.options
+        opts = validate_options(self._config_entry.options)
 
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
@@ -308,31 +333,31 @@ class PeplinkOptionsFlow(OptionsFlow):
             {
                 vol.Required(
                     CONF_STATUS_INTERVAL,
-                    default=int(opts.get(CONF_STATUS_INTERVAL, DEFAULT_STATUS_INTERVAL)),
+                    default=opts[CONF_STATUS_INTERVAL],
                 ): vol.All(int, vol.Range(min=MIN_INTERVAL, max=MAX_INTERVAL)),
                 vol.Required(
                     CONF_USAGE_INTERVAL,
-                    default=int(opts.get(CONF_USAGE_INTERVAL, DEFAULT_USAGE_INTERVAL)),
+                    default=opts[CONF_USAGE_INTERVAL],
                 ): vol.All(int, vol.Range(min=MIN_INTERVAL, max=MAX_INTERVAL)),
                 vol.Required(
                     CONF_DIAG_INTERVAL,
-                    default=int(opts.get(CONF_DIAG_INTERVAL, DEFAULT_DIAG_INTERVAL)),
+                    default=opts[CONF_DIAG_INTERVAL],
                 ): vol.All(int, vol.Range(min=MIN_INTERVAL, max=MAX_INTERVAL)),
                 vol.Required(
                     CONF_ENABLE_VPN,
-                    default=bool(opts.get(CONF_ENABLE_VPN, False)),
+                    default=opts[CONF_ENABLE_VPN],
                 ): bool,
                 vol.Required(
                     CONF_VPN_INTERVAL,
-                    default=int(opts.get(CONF_VPN_INTERVAL, DEFAULT_VPN_INTERVAL)),
+                    default=opts[CONF_VPN_INTERVAL],
                 ): vol.All(int, vol.Range(min=MIN_INTERVAL, max=MAX_INTERVAL)),
                 vol.Required(
                     CONF_ENABLE_GPS,
-                    default=bool(opts.get(CONF_ENABLE_GPS, False)),
+                    default=opts[CONF_ENABLE_GPS],
                 ): bool,
                 vol.Required(
                     CONF_GPS_INTERVAL,
-                    default=int(opts.get(CONF_GPS_INTERVAL, DEFAULT_GPS_INTERVAL)),
+                    default=opts[CONF_GPS_INTERVAL],
                 ): vol.All(int, vol.Range(min=MIN_INTERVAL, max=MAX_INTERVAL)),
             }
         )
@@ -65,7 +65,9 @@ MAX_SIM_SLOTS = 5
 # WAN IDs to probe during discovery.
 # The legacy plugin used 1-10, but some routers expose additional/virtual WANs
 # (including vWAN) at higher numeric IDs.
-WAN_DISCOVERY_IDS = list(range(1, 33))
+WAN_DISCOVERY_IDS = tuple(range(1, 33))
+# Same IDs as the space-separated "id" query value the status endpoint expects
+WAN_DISCOVERY_IDS_STR = " ".join(str(conn_id) for conn_id in WAN_DISCOVERY_IDS)
 
 # Token lifetime in seconds (46 hours, match TOKEN_REFRESH_INTERVAL_MS in PeplinkApiClient.kt)
 TOKEN_REFRESH_SECS = 46 * 60 * 60
@@ -1,18 +1,24 @@
 """Peplink Router DataUpdateCoordinator.
 
-Single coordinator with multi-cadence polling via timestamp dispatch.
+Single coordinator with multi-cadence polling via timestamp dispatch;
+slow polls that come due on the same tick run concurrently.
 Mirrors PeplinkPollingManager.kt + PeplinkPlugin.kt poll logic.
 """
 from __future__ import annotations
 
-import dataclasses
+import asyncio
 import logging
 import time
+from collections.abc import Mapping
 from datetime import timedelta
+from typing import Any
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import PeplinkApiClient, PeplinkAuthError, PeplinkConnectionError, PeplinkApiError
@@ -38,8 +44,10 @@ from .const import (
     DEFAULT_USAGE_INTERVAL,
     DEFAULT_VPN_INTERVAL,
     DOMAIN,
+    MAX_INTERVAL,
     MAX_SIM_SLOTS,
-    WAN_DISCOVERY_IDS,
+    MIN_INTERVAL,
+    WAN_DISCOVERY_IDS_STR,
     WAN_TYPE_CELLULAR,
 )
 from .models import (
@@ -50,44 +58,91 @@ from .models import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_INTERVAL = vol.All(vol.Coerce(int), vol.Range(min=MIN_INTERVAL, max=MAX_INTERVAL))
+
+# Entry options with defaults filled in; validated once per load/options change
+# so the coordinator reads native ints/bools.
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_STATUS_INTERVAL, default=DEFAULT_STATUS_INTERVAL): _INTERVAL,
+        vol.Optional(CONF_USAGE_INTERVAL, default=DEFAULT_USAGE_INTERVAL): _INTERVAL,
+        vol.Optional(CONF_DIAG_INTERVAL, default=DEFAULT_DIAG_INTERVAL): _INTERVAL,
+        vol.Optional(CONF_VPN_INTERVAL, default=DEFAULT_VPN_INTERVAL): _INTERVAL,
+        vol.Optional(CONF_GPS_INTERVAL, default=DEFAULT_GPS_INTERVAL): _INTERVAL,
+        vol.Optional(CONF_ENABLE_VPN, default=False): cv.boolean,
+        vol.Optional(CONF_ENABLE_GPS, default=False): cv.boolean,
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def validate_options(options: Mapping[str, Any]) -> dict[str, Any]:
+    """Return typed entry options; invalid stored values fall back to their defaults.
+
+    Only the offending keys are defaulted, so a bad interval doesn't also
+    reset the VPN/GPS toggles.
+    """
+    opts = dict(options)
+    try:
+        return OPTIONS_SCHEMA(opts)
+    except vol.MultipleInvalid as err:
+        for error in err.errors:
+            if error.path:
+                opts.pop(error.path[0], None)
+        _LOGGER.warning("Invalid options (%s); using defaults for those keys", err)
+    return OPTIONS_SCHEMA(opts)
+
+
+async def _noop() -> None:
+    """Placeholder for a gather slot whose request is skipped this cycle."""
+
+
+def _build_vpn_profiles(raw: dict[str, tuple[str, str, str]]) -> dict[str, VpnProfile]:
+    """Build VpnProfile models from get_pep_vpn_profiles() (id -> (name, type, status))."""
+    return {
+        pid: VpnProfile(profile_id=pid, name=name, vpn_type=vpn_type, status=status)
+        for pid, (name, vpn_type, status) in raw.items()
+    }
+
 
 class PeplinkCoordinator(DataUpdateCoordinator[PeplinkData]):
     """Coordinator for all Peplink polling.
 
     Update interval = status_interval (default 10s, fastest cadence).
     Slower polls (usage/diag/vpn/gps) piggyback via timestamp dispatch.
+    Listeners are only notified when the polled data actually changed.
     """
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.entry = entry
-        opts = {**entry.data, **entry.options}
-
-        status_interval = int(opts.get(CONF_STATUS_INTERVAL, DEFAULT_STATUS_INTERVAL))
+        # Connection settings live in entry.data; the options flow only edits polling
+        data = entry.data
+        self.options: dict[str, Any] = validate_options(entry.options)
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=status_interval),
+            update_interval=timedelta(seconds=self.options[CONF_STATUS_INTERVAL]),
+            # PeplinkData is a tree of dataclasses, so __eq__ compares by value;
+            # identical polls skip listener dispatch (no-op state writes).
+            always_update=False,
         )
 
         self.api = PeplinkApiClient(
-            base_url=opts[CONF_BASE_URL],
-            auth_mode=opts[CONF_AUTH_MODE],
-            username=opts.get(CONF_USERNAME, ""),
-            password=opts.get(CONF_PASSWORD, ""),
-            client_id=opts.get(CONF_CLIENT_ID, ""),
-            client_secret=opts.get(CONF_CLIENT_SECRET, ""),
-            verify_ssl=opts.get(CONF_VERIFY_SSL, True),
+            base_url=data[CONF_BASE_URL],
+            auth_mode=data[CONF_AUTH_MODE],
+            username=data.get(CONF_USERNAME, ""),
+            password=data.get(CONF_PASSWORD, ""),
+            client_id=data.get(CONF_CLIENT_ID, ""),
+            client_secret=data.get(CONF_CLIENT_SECRET, ""),
+            verify_ssl=data.get(CONF_VERIFY_SSL, True),
         )
 
         # --- Polling intervals ---
-        self._usage_interval = int(opts.get(CONF_USAGE_INTERVAL, DEFAULT_USAGE_INTERVAL))
-        self._diag_interval = int(opts.get(CONF_DIAG_INTERVAL, DEFAULT_DIAG_INTERVAL))
-        self._enable_vpn = bool(opts.get(CONF_ENABLE_VPN, False))
-        self._vpn_interval = int(opts.get(CONF_VPN_INTERVAL, DEFAULT_VPN_INTERVAL))
-        self._enable_gps = bool(opts.get(CONF_ENABLE_GPS, False))
-        self._gps_interval = int(opts.get(CONF_GPS_INTERVAL, DEFAULT_GPS_INTERVAL))
+        self._apply_intervals(self.options)
+        self._enable_vpn: bool = self.options[CONF_ENABLE_VPN]
+        self._enable_gps: bool = self.options[CONF_ENABLE_GPS]
 
         # --- Multi-cadence timestamps (time.monotonic()) ---
         self._last_usage_poll: float = 0.0
@@ -114,13 +169,33 @@ class PeplinkCoordinator(DataUpdateCoordinator[PeplinkData]):
         # --- Discovered hardware (set by async_discover_hardware) ---
         # wan_connections: which WANs exist and their types (stable after discovery)
         self.wan_connections: dict[int, WanConnection] = {}
+        # wan_connections ids grouped by WAN_TYPE_* (sorted), for per-type entity setup
+        self.wan_by_type: dict[str, tuple[int, ...]] = {}
+        # WAN ids present in the latest successful status poll (entity availability)
+        self.available_wan_ids: frozenset[int] = frozenset()
+        # Bumped on every successful update; entities key per-update caches on it
+        self.data_version: int = 0
+        # Status poll id filter, built once per discovery (None = probe full range)
+        self._status_id_query: str | None = None
         # vpn_profiles from discovery (used to create entities at setup)
         self.vpn_profiles_at_discovery: dict[str, VpnProfile] = {}
 
-    @staticmethod
-    def _build_discovery_id_query() -> str:
-        """Build the WAN ID probe list used during discovery/polling."""
-        return " ".join(str(conn_id) for conn_id in WAN_DISCOVERY_IDS)
+    def _apply_intervals(self, opts: dict[str, Any]) -> None:
+        """Set the slow-poll intervals from validated options."""
+        self._usage_interval: int = opts[CONF_USAGE_INTERVAL]
+        self._diag_interval: int = opts[CONF_DIAG_INTERVAL]
+        self._vpn_interval: int = opts[CONF_VPN_INTERVAL]
+        self._gps_interval: int = opts[CONF_GPS_INTERVAL]
+
+    def update_options(self, options: dict[str, Any]) -> None:
+        """Apply non-structural option changes (poll intervals) in place.
+
+        Takes options already passed through validate_options().
+        Feature toggles (VPN/GPS) change the entity set and require a reload instead.
+        """
+        self.options = options
+        self._apply_intervals(options)
+        self.update_interval = timedelta(seconds=options[CONF_STATUS_INTERVAL])
 
     # ===== HARDWARE DISCOVERY =====
 
@@ -132,11 +207,18 @@ class PeplinkCoordinator(DataUpdateCoordinator[PeplinkData]):
         Raises ConfigEntryNotReady on failure.
         """
         _LOGGER.info("Starting Peplink hardware discovery")
-        probe_ids = self._build_discovery_id_query()
-        try:
-            wan_connections = await self.api.get_wan_status(probe_ids)
-        except (PeplinkAuthError, PeplinkConnectionError, PeplinkApiError) as err:
-            raise ConfigEntryNotReady(f"Hardware discovery failed: {err}") from err
+        # If VPN is enabled, also discover profiles now so entity platform can create
+        # entities — concurrently with the WAN probe, so setup waits on one round trip.
+        jobs = [self.api.get_wan_status(WAN_DISCOVERY_IDS_STR)]
+        if self._enable_vpn:
+            jobs.append(self.api.get_pep_vpn_profiles())
+        wan_connections, *vpn_results = await asyncio.gather(*jobs, return_exceptions=True)
+        if isinstance(wan_connections, (PeplinkAuthError, PeplinkConnectionError, PeplinkApiError)):
+            raise ConfigEntryNotReady(
+                f"Hardware discovery failed: {wan_connections}"
+            ) from wan_connections
+        if isinstance(wan_connections, BaseException):
+            raise wan_connections
 
         # Some firmware variants expose virtual WAN IDs outside the default probe
         # range. If we found no WANs, retry once without an explicit id filter.
@@ -153,11 +235,19 @@ class PeplinkCoordinator(DataUpdateCoordinator[PeplinkData]):
                 pass
 
         # Mark all cellular connections with 5 SIM slots (per enrichCellularWithSimSlots)
-        for conn_id, conn in wan_connections.items():
+        # and index the ids by type so platforms don't each re-scan for their subset.
+        wan_by_type: dict[str, list[int]] = {}
+        for conn_id, conn in sorted(wan_connections.items()):
             if conn.wan_type == WAN_TYPE_CELLULAR:
-                wan_connections[conn_id] = dataclasses.replace(conn, sim_slot_count=MAX_SIM_SLOTS)
+                conn.sim_slot_count = MAX_SIM_SLOTS
+            wan_by_type.setdefault(conn.wan_type, []).append(conn_id)
 
         self.wan_connections = wan_connections
+        self._status_id_query = (
+            " ".join(str(conn_id) for conn_id in sorted(wan_connections))
+            if wan_connections else None
+        )
+        self.wan_by_type = {wan_type: tuple(ids) for wan_type, ids in wan_by_type.items()}
         _LOGGER.info(
             "Peplink hardware discovery complete: %d WAN connections found",
             len(wan_connections),
@@ -168,99 +258,71 @@ class PeplinkCoordinator(DataUpdateCoordinator[PeplinkData]):
                 conn_id, conn.name, conn.wan_type, conn.enabled, conn.sim_slot_count,
             )
 
-        # If VPN is enabled, also discover profiles now so entity platform can create entities
-        if self._enable_vpn:
-            try:
-                raw = await self.api.get_pep_vpn_profiles()
-                self.vpn_profiles_at_discovery = {
-                    pid: VpnProfile(
-                        profile_id=pid,
-                        name=triple[0],
-                        vpn_type=triple[1],
-                        status=triple[2],
-                    )
-                    for pid, triple in raw.items()
-                }
-                _LOGGER.info(
-                    "VPN profiles discovered: %d", len(self.vpn_profiles_at_discovery)
-                )
-            except (PeplinkAuthError, PeplinkConnectionError, PeplinkApiError) as err:
-                _LOGGER.warning("VPN profile discovery failed (non-fatal): %s", err)
+        for raw in vpn_results:
+            if isinstance(raw, (PeplinkAuthError, PeplinkConnectionError, PeplinkApiError)):
+                _LOGGER.warning("VPN profile discovery failed (non-fatal): %s", raw)
+                continue
+            if isinstance(raw, BaseException):
+                raise raw
+            self.vpn_profiles_at_discovery = _build_vpn_profiles(raw)
+            # Seed the VPN cache so the first refresh doesn't re-fetch the same data
+            self._vpn_profiles = dict(self.vpn_profiles_at_discovery)
+            self._last_vpn_poll = time.monotonic()
+            _LOGGER.info(
+                "VPN profiles discovered: %d", len(self.vpn_profiles_at_discovery)
+            )
 
     # ===== COORDINATOR UPDATE =====
 
     async def _async_update_data(self) -> PeplinkData:
         """Fetch latest data. Called every status_interval seconds by coordinator.
 
-        Multi-cadence dispatch: slower polls run only when their interval has elapsed.
+        Multi-cadence dispatch: slower polls run only when their interval has elapsed,
+        concurrently with the status poll.
         Port of the polling dispatch in PeplinkPlugin.kt + PeplinkPollingManager.kt.
         """
         now = time.monotonic()
 
-        # --- Always: status poll (bandwidth comes from diag poll below) ---
-        try:
-            if self.wan_connections:
-                conn_ids = " ".join(str(conn_id) for conn_id in sorted(self.wan_connections))
-            else:
-                conn_ids = self._build_discovery_id_query()
-            new_wan = await self.api.get_wan_status(conn_ids)
-            self._api_connected = True
-            self._authenticated = self.api.is_authenticated()
-            self._data_healthy = len(new_wan) > 0
-        except PeplinkAuthError as err:
-            self._api_connected = True
-            self._authenticated = False
-            self._data_healthy = False
-            raise UpdateFailed(f"Authentication error: {err}") from err
-        except (PeplinkConnectionError, PeplinkApiError) as err:
-            self._api_connected = False
-            self._authenticated = False
-            self._data_healthy = False
-            raise UpdateFailed(f"Status poll failed: {err}") from err
-
-        # Enrich with sim_slot_count from discovered hardware config
-        for conn_id, conn in new_wan.items():
-            discovered = self.wan_connections.get(conn_id)
-            if discovered and discovered.sim_slot_count > conn.sim_slot_count:
-                new_wan[conn_id] = dataclasses.replace(conn, sim_slot_count=discovered.sim_slot_count)
-
-        # Merge in latest traffic stats (from previous diag poll)
-        for conn_id, (dl, ul) in self._traffic_stats.items():
-            if conn_id in new_wan:
-                new_wan[conn_id] = dataclasses.replace(
-                    new_wan[conn_id],
-                    download_rate_mbps=dl,
-                    upload_rate_mbps=ul,
-                )
-
-        # --- Conditionally: usage poll ---
+        # --- Conditionally: slower polls (each handles its own errors) ---
+        polls = []
         if now - self._last_usage_poll >= self._usage_interval:
-            await self._poll_usage()
+            polls.append(self._poll_usage())
             self._last_usage_poll = now
-
-        # --- Conditionally: diagnostics poll (includes traffic stats) ---
         if now - self._last_diag_poll >= self._diag_interval:
-            await self._poll_diagnostics()
+            polls.append(self._poll_diagnostics())   # Includes traffic stats
             self._last_diag_poll = now
-            # Re-merge fresh traffic stats into the wan data just polled
-            for conn_id, (dl, ul) in self._traffic_stats.items():
-                if conn_id in new_wan:
-                    new_wan[conn_id] = dataclasses.replace(
-                        new_wan[conn_id],
-                        download_rate_mbps=dl,
-                        upload_rate_mbps=ul,
-                    )
-
-        # --- Conditionally: VPN poll ---
         if self._enable_vpn and now - self._last_vpn_poll >= self._vpn_interval:
-            await self._poll_vpn()
+            polls.append(self._poll_vpn())
             self._last_vpn_poll = now
-
-        # --- Conditionally: GPS poll ---
         if self._enable_gps and now - self._last_gps_poll >= self._gps_interval:
-            await self._poll_gps()
+            polls.append(self._poll_gps())
             self._last_gps_poll = now
 
+        # --- Always: status poll, concurrently with whichever slow polls are due ---
+        new_wan, *poll_results = await asyncio.gather(
+            self._poll_status(), *polls, return_exceptions=True
+        )
+        for result in poll_results:
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Slow poll failed unexpectedly: %s", result)
+        if isinstance(new_wan, BaseException):
+            raise new_wan
+
+        # The status poll parses fresh WanConnection objects, so enrich them in place
+        # in one pass: sim_slot_count from discovered hardware config, plus the latest
+        # traffic stats (fresh if the diag poll just ran, else cached).
+        traffic_stats = self._traffic_stats
+        for conn_id, conn in new_wan.items():
+            discovered = self.wan_connections.get(conn_id)
+            if discovered and discovered.sim_slot_count > conn.sim_slot_count:
+                conn.sim_slot_count = discovered.sim_slot_count
+            rates = traffic_stats.get(conn_id)
+            if rates is not None:
+                conn.download_rate_mbps, conn.upload_rate_mbps = rates
+
+        self.available_wan_ids = frozenset(new_wan)
+        self.data_version += 1
+
         return PeplinkData(
             wan_connections=new_wan,
             wan_usage=self._wan_usage,
@@ -277,6 +339,29 @@ class PeplinkCoordinator(DataUpdateCoordinator[PeplinkData]):
             data_healthy=self._data_healthy,
         )
 
+    async def _poll_status(self) -> dict[int, WanConnection]:
+        """Status poll — WAN connections (bandwidth comes from the diag poll).
+
+        Failure is fatal for the update: raises UpdateFailed and flags health state.
+        """
+        try:
+            conn_ids = self._status_id_query or WAN_DISCOVERY_IDS_STR
+            new_wan = await self.api.get_wan_status(conn_ids)
+        except PeplinkAuthError as err:
+            self._api_connected = True
+            self._authenticated = False
+            self._data_healthy = False
+            raise UpdateFailed(f"Authentication error: {err}") from err
+        except (PeplinkConnectionError, PeplinkApiError) as err:
+            self._api_connected = False
+            self._authenticated = False
+            self._data_healthy = False
+            raise UpdateFailed(f"Status poll failed: {err}") from err
+        self._api_connected = True
+        self._authenticated = self.api.is_authenticated()
+        self._data_healthy = len(new_wan) > 0
+        return new_wan
+
     # ===== SLOW POLLS =====
 
     async def _poll_usage(self) -> None:
@@ -289,42 +374,52 @@ class PeplinkCoordinator(DataUpdateCoordinator[PeplinkData]):
 
     async def _poll_diagnostics(self) -> None:
         """Diagnostics poll — temperature, fans, device info, connected clients, bandwidth."""
-        # System diagnostics (temperature + fans)
-        try:
-            self._diagnostics = await self.api.get_system_diagnostics()
-        except Exception as err:
-            _LOGGER.warning("System diagnostics poll failed: %s", err)
-
-        # Device info (serial, model, hw version)
-        try:
-            self._device_info = await self.api.get_device_info()
-        except Exception as err:
-            _LOGGER.warning("Device info poll failed: %s", err)
-
-        # Firmware version (fetched once and cached from diag poll)
-        if self._firmware_version is None:
-            try:
-                self._firmware_version = await self.api.get_firmware_version()
-            except Exception as err:
-                _LOGGER.warning("Firmware version poll failed: %s", err)
-
-        # Connected client count
-        try:
-            self._connected_devices = await self.api.get_connected_devices_count()
-        except Exception as err:
-            _LOGGER.warning("Connected devices poll failed: %s", err)
-
-        # Traffic / bandwidth stats (per WAN, in Mbps)
-        try:
-            self._traffic_stats = await self.api.get_traffic_stats()
-        except Exception as err:
-            _LOGGER.warning("Traffic stats poll failed: %s", err)
-
-        # SpeedFusion Connect quota (web-admin vars; needs admin credentials)
-        try:
-            self._sfc = await self.api.get_sfc_quota()
-        except Exception as err:
-            _LOGGER.warning("SFC quota poll failed: %s", err)
+        # Independent requests, issued concurrently. The web-admin (MANGA) ones
+        # (system info, SFC) still serialize on its session lock.
+        (
+            system_info, connected_devices, traffic_stats, sfc, firmware_version
+        ) = await asyncio.gather(
+            # System diagnostics (temperature + fans) and device info (serial,
+            # model, hw version) — one status.system.info request
+            self.api.get_system_info(),
+            # Connected client count
+            self.api.get_connected_devices_count(),
+            # Traffic / bandwidth stats (per WAN, in Mbps)
+            self.api.get_traffic_stats(),
+            # SpeedFusion Connect quota (web-admin vars; needs admin credentials)
+            self.api.get_sfc_quota(),
+            # Firmware version (fetched once and cached from diag poll)
+            self.api.get_firmware_version() if self._firmware_version is None else _noop(),
+            return_exceptions=True,
+        )
+        for result in (system_info, connected_devices, traffic_stats, sfc, firmware_version):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+
+        if isinstance(system_info, Exception):
+            _LOGGER.warning("System info poll failed: %s", system_info)
+        else:
+            self._diagnostics, self._device_info = system_info
+
+        if isinstance(connected_devices, Exception):
+            _LOGGER.warning("Connected devices poll failed: %s", connected_devices)
+        else:
+            self._connected_devices = connected_devices
+
+        if isinstance(traffic_stats, Exception):
+            _LOGGER.warning("Traffic stats poll failed: %s", traffic_stats)
+        else:
+            self._traffic_stats = traffic_stats
+
+        if isinstance(sfc, Exception):
+            _LOGGER.warning("SFC quota poll failed: %s", sfc)
+        else:
+            self._sfc = sfc
+
+        if isinstance(firmware_version, Exception):
+            _LOGGER.warning("Firmware version poll failed: %s", firmware_version)
+        elif firmware_version is not None:
+            self._firmware_version = firmware_version
 
         _LOGGER.debug("Diagnostics poll successful")
 
@@ -332,15 +427,7 @@ class PeplinkCoordinator(DataUpdateCoordinator[PeplinkData]):
         """VPN poll — PepVPN profile statuses."""
         try:
             raw = await self.api.get_pep_vpn_profiles()
-            self._vpn_profiles = {
-                pid: VpnProfile(
-                    profile_id=pid,
-                    name=triple[0],
-                    vpn_type=triple[1],
-                    status=triple[2],
-                )
-                for pid, triple in raw.items()
-            }
+            self._vpn_profiles = _build_vpn_profiles(raw)
             _LOGGER.debug("VPN poll successful (%d profiles)", len(self._vpn_profiles))
         except (PeplinkAuthError, PeplinkConnectionError, PeplinkApiError) as err:
             _LOGGER.warning("VPN poll failed (non-fatal): %s", err)
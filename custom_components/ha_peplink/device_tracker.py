@@ -10,15 +10,19 @@ import logging
 
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_ENABLE_GPS, DOMAIN
 from .coordinator import PeplinkCoordinator
 from .entity import PeplinkEntity
+from .models import LocationInfo
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared attributes for "no location data"; HA copies attributes, never mutates them
+_EMPTY_ATTRS: dict = {}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,9 +30,9 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up GPS device tracker entity (no-op when GPS is disabled)."""
-    if not entry.options.get(CONF_ENABLE_GPS, False):
-        return
     coordinator: PeplinkCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if not coordinator.options[CONF_ENABLE_GPS]:
+        return
     async_add_entities([RouterLocationTracker(coordinator, entry)])
 
 
@@ -45,53 +49,66 @@ class RouterLocationTracker(PeplinkEntity, TrackerEntity):
     _attr_icon = "mdi:crosshairs-gps"
     _attr_source_type = SourceType.GPS
 
+    # (LocationInfo field, state attribute name); None-valued fields are omitted
+    _ATTR_FIELDS = (
+        ("altitude", "altitude"),
+        ("speed", "speed"),
+        ("heading", "heading"),
+        ("accuracy", "gps_accuracy"),
+        ("timestamp", "last_updated"),
+    )
+
     def __init__(self, coordinator: PeplinkCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_location"
+        self._location: LocationInfo | None = None
+        self._attrs: dict = _EMPTY_ATTRS
+        self._refresh_location()
+
+    def _refresh_location(self) -> None:
+        """Resolve the latest location (and its attributes) once per coordinator update."""
+        data = self.coordinator.data
+        loc = self._location = data.location if data is not None else None
+        if loc is None:
+            self._attrs = _EMPTY_ATTRS
+            return
+        self._attrs = {
+            key: value
+            for field_name, key in self._ATTR_FIELDS
+            if (value := getattr(loc, field_name)) is not None
+        } or _EMPTY_ATTRS
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._refresh_location()
+        super()._handle_coordinator_update()
 
     @property
     def latitude(self) -> float | None:
-        if self.coordinator.data is None or self.coordinator.data.location is None:
-            return None
-        return self.coordinator.data.location.latitude
+        loc = self._location
+        return loc.latitude if loc is not None else None
 
     @property
     def longitude(self) -> float | None:
-        if self.coordinator.data is None or self.coordinator.data.location is None:
-            return None
-        return self.coordinator.data.location.longitude
+        loc = self._location
+        return loc.longitude if loc is not None else None
 
     @property
     def location_accuracy(self) -> int:
-        if self.coordinator.data is None or self.coordinator.data.location is None:
+        loc = self._location
+        if loc is None or loc.accuracy is None:
             return 0
-        acc = self.coordinator.data.location.accuracy
-        return int(acc) if acc is not None else 0
+        return int(loc.accuracy)
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Additional GPS attributes for display in HA."""
-        if self.coordinator.data is None or self.coordinator.data.location is None:
-            return {}
-        loc = self.coordinator.data.location
-        attrs: dict = {}
-        if loc.altitude is not None:
-            attrs["altitude"] = loc.altitude
-        if loc.speed is not None:
-            attrs["speed"] = loc.speed
-        if loc.heading is not None:
-            attrs["heading"] = loc.heading
-        if loc.accuracy is not None:
-            attrs["gps_accuracy"] = loc.accuracy
-        if loc.timestamp is not None:
-            attrs["last_updated"] = loc.timestamp
-        return attrs
+        """Additional GPS attributes for display in HA (built once per update)."""
+        return self._attrs
 
     @property
     def available(self) -> bool:
         """Available when coordinator is healthy and GPS has a valid fix."""
         if not super().available:
             return False
-        if self.coordinator.data is None or self.coordinator.data.location is None:
-            return False
-        return self.coordinator.data.location.has_valid_fix
+        loc = self._location
+        return loc is not None and loc.has_valid_fix
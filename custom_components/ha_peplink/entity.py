@@ -18,6 +18,8 @@ class PeplinkEntity(CoordinatorEntity[PeplinkCoordinator]):
     def __init__(self, coordinator: PeplinkCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
         self._entry = entry
+        # entry.data is fixed for the life of the entry
+        self._device_name = f"Peplink Router ({entry.data.get(CONF_INSTANCE_NAME, 'Main')})"
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -26,7 +28,6 @@ class PeplinkEntity(CoordinatorEntity[PeplinkCoordinator]):
         Device name format matches Android plugin: 'Peplink Router ({instance_name})'.
         Model/sw_version/serial populated from diag poll once available.
         """
-        instance_name = self._entry.data.get(CONF_INSTANCE_NAME, "Main")
         data = self.coordinator.data
 
         model = None
@@ -40,7 +41,7 @@ class PeplinkEntity(CoordinatorEntity[PeplinkCoordinator]):
 
         return DeviceInfo(
             identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"Peplink Router ({instance_name})",
+            name=self._device_name,
             manufacturer="Peplink",
             model=model,
             sw_version=sw_version,
@@ -49,26 +50,45 @@ class PeplinkEntity(CoordinatorEntity[PeplinkCoordinator]):
 
 
 class PeplinkWanEntity(PeplinkEntity):
-    """Base entity for per-WAN entities."""
+    """Base entity for per-WAN entities.
+
+    Subclasses declare _SUFFIX; the unique id is '{entry_id}_wan{conn_id}_{_SUFFIX}'.
+    Declaring _NAME_SUFFIX names the entity '{wan.name} {_NAME_SUFFIX}'.
+    """
+
+    _SUFFIX: str | None = None
+    _NAME_SUFFIX: str | None = None
 
     def __init__(
         self, coordinator: PeplinkCoordinator, entry: ConfigEntry, conn_id: int
     ) -> None:
         super().__init__(coordinator, entry)
         self._conn_id = conn_id
+        if self._SUFFIX is not None:
+            self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_{self._SUFFIX}"
+        # Discovered WAN name, used to build entity names once. Fixed for the entity's
+        # lifetime: rediscovery reloads the entry when a WAN is renamed.
+        wan = coordinator.wan_connections.get(conn_id)
+        self._wan_name = wan.name if wan else f"WAN {conn_id}"
+        if self._NAME_SUFFIX is not None:
+            self._attr_name = f"{self._wan_name} {self._NAME_SUFFIX}"
+        self._wan_cached: WanConnection | None = None
+        self._wan_version = -1
 
     @property
     def available(self) -> bool:
         """Unavailable if coordinator is unhealthy or WAN not in latest data."""
-        if not super().available:
-            return False
-        if self.coordinator.data is None:
-            return False
-        return self._conn_id in self.coordinator.data.wan_connections
+        return super().available and self._conn_id in self.coordinator.available_wan_ids
 
     @property
     def _wan(self) -> WanConnection | None:
-        """Convenience accessor for the live WAN data."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.wan_connections.get(self._conn_id)
+        """Convenience accessor for the live WAN data.
+
+        Looked up once per coordinator update; HA reads several properties per state write.
+        """
+        version = self.coordinator.data_version
+        if version != self._wan_version:
+            data = self.coordinator.data
+            self._wan_cached = data.wan_connections.get(self._conn_id) if data is not None else None
+            self._wan_version = version
+        return self._wan_cached
@@ -1,7 +1,8 @@
 """Data models for Peplink Router integration.
 
 Direct Python port of PeplinkModels.kt — all fields nullable where
-the Kotlin source uses null/?.
+the Kotlin source uses null/?. Slotted dataclasses: many instances are
+rebuilt on every poll, so no per-instance __dict__.
 """
 from __future__ import annotations
 
@@ -10,7 +11,7 @@ from dataclasses import dataclass, field
 
 # ===== WAN CONNECTION =====
 
-@dataclass
+@dataclass(slots=True)
 class CellularInfo:
     """Cellular modem information from WAN status API."""
     module_name: str
@@ -25,7 +26,7 @@ class CellularInfo:
     rsrp_dbm: int | None              # Raw RSRP from first active band
 
 
-@dataclass
+@dataclass(slots=True)
 class WifiInfo:
     """WiFi WAN information."""
     ssid: str | None
@@ -34,7 +35,7 @@ class WifiInfo:
     channel: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class SimSlotInfo:
     """Per-SIM slot usage information."""
     slot_id: int
@@ -46,7 +47,7 @@ class SimSlotInfo:
     start_date: str | None            # Billing cycle start (day-of-month string)
 
 
-@dataclass
+@dataclass(slots=True)
 class WanConnection:
     """WAN connection status from /api/status.wan.connection."""
     conn_id: int
@@ -65,7 +66,7 @@ class WanConnection:
     upload_rate_mbps: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WanUsage:
     """WAN usage/allowance from /api/status.wan.connection.allowance."""
     conn_id: int
@@ -80,7 +81,7 @@ class WanUsage:
 
 # ===== DIAGNOSTICS =====
 
-@dataclass
+@dataclass(slots=True)
 class FanInfo:
     """Fan speed information from system diagnostics."""
     fan_id: int
@@ -90,15 +91,20 @@ class FanInfo:
     status: str = "normal"            # "normal", "warning", "critical", "off"
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemDiagnostics:
     """System diagnostics from /cgi-bin/MANGA/api.cgi."""
     temperature: float | None
     temperature_threshold: float | None
     fans: list[FanInfo] = field(default_factory=list)
+    # fans indexed by fan_id (derived once, not compared)
+    fans_by_id: dict[int, FanInfo] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.fans_by_id = {fan.fan_id: fan for fan in self.fans}
 
-@dataclass
+
+@dataclass(slots=True)
 class DeviceInfo:
     """Device hardware information."""
     serial_number: str
@@ -108,7 +114,7 @@ class DeviceInfo:
 
 # ===== SPEEDFUSION CONNECT =====
 
-@dataclass
+@dataclass(slots=True)
 class SfcQuota:
     """SpeedFusion Connect data allowance, parsed from the web-admin vars blob
     (/cgi-bin/MANGA/index.cgi?mode=js). Not available via the REST API."""
@@ -122,7 +128,7 @@ class SfcQuota:
 
 # ===== VPN =====
 
-@dataclass
+@dataclass(slots=True)
 class VpnProfile:
     """PepVPN profile status from /api/status.pepvpn."""
     profile_id: str
@@ -133,9 +139,12 @@ class VpnProfile:
 
 # ===== GPS =====
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LocationInfo:
-    """GPS location from /api/info.location."""
+    """GPS location from /api/info.location.
+
+    Frozen: built once per GPS poll, so has_valid_fix is computed at construction.
+    """
     latitude: float | None
     longitude: float | None
     altitude: float | None            # Metres above sea level
@@ -143,16 +152,18 @@ class LocationInfo:
     heading: float | None             # Degrees 0-360, 0=North
     accuracy: float | None            # Horizontal accuracy metres
     timestamp: int | None             # Unix timestamp seconds
+    # True if we have a usable lat/lon fix (derived, not compared)
+    has_valid_fix: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def has_valid_fix(self) -> bool:
-        """True if we have a usable lat/lon fix."""
-        return self.latitude is not None and self.longitude is not None
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "has_valid_fix", self.latitude is not None and self.longitude is not None
+        )
 
 
 # ===== AGGREGATED COORDINATOR DATA =====
 
-@dataclass
+@dataclass(slots=True)
 class PeplinkData:
     """All polled data combined by the coordinator on each cycle."""
     wan_connections: dict[int, WanConnection]           # Status poll (10s)
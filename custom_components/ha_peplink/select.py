@@ -5,20 +5,28 @@ Entity names match the Android plugin MQTT discovery names exactly.
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
+from .api import PeplinkApiError, PeplinkAuthError, PeplinkConnectionError
 from .const import DOMAIN
 from .coordinator import PeplinkCoordinator
 from .entity import PeplinkWanEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait after a priority change before confirming it with a real poll
+CONFIRM_REFRESH_DELAY = 3
+
 PRIORITY_OPTIONS = ["1", "2", "3", "4", "Disabled"]
+# Option indexed by wan.priority; anything outside 1-4 (or None) shows as "Disabled"
+_PRIORITY_BY_LEVEL = ("Disabled", "1", "2", "3", "4")
 
 
 async def async_setup_entry(
@@ -38,41 +46,73 @@ async def async_setup_entry(
 class WanPrioritySelect(PeplinkWanEntity, SelectEntity):
     """WAN priority selector. Name: '{wan.name} Priority Control'.
 
-    Calls api.set_wan_priority() then requests coordinator refresh.
+    Calls api.set_wan_priority(), shows the new priority optimistically on this
+    entity only, then confirms it with a delayed coordinator refresh.
     Priority 1-4 or 'Disabled' (→ null/enable:false in API payload).
     """
 
+    _SUFFIX = "priority_control"
+    _NAME_SUFFIX = "Priority Control"
     _attr_options = PRIORITY_OPTIONS
     _attr_icon = "mdi:priority-high"
 
     def __init__(self, coordinator, entry, conn_id):
         super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_priority_control"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Priority Control" if wan else f"WAN {self._conn_id} Priority Control"
+        self._cancel_confirm: CALLBACK_TYPE | None = None
+        # Option just sent to the router; shown until the next coordinator update
+        self._pending_option: str | None = None
 
     @property
     def current_option(self) -> str | None:
         """Current priority string sourced from WAN status data."""
+        if self._pending_option is not None:
+            return self._pending_option
         wan = self._wan
         if wan is None:
             return None
-        if wan.priority is None:
-            return "Disabled"
-        p = str(wan.priority)
-        return p if p in PRIORITY_OPTIONS else "Disabled"
+        p = wan.priority
+        return _PRIORITY_BY_LEVEL[p] if p is not None and 0 < p < 5 else "Disabled"
 
     async def async_select_option(self, option: str) -> None:
         """Send priority change to router. Port of handleCommand(priority) in PeplinkPlugin.kt."""
         priority = None if option == "Disabled" else int(option)
         try:
             await self.coordinator.api.set_wan_priority(self._conn_id, priority)
-        except Exception as err:
+        except (PeplinkAuthError, PeplinkConnectionError, PeplinkApiError) as err:
             raise HomeAssistantError(
                 f"Failed to set WAN {self._conn_id} priority to {option}: {err}"
             ) from err
-        # Refresh coordinator so UI reflects new priority without waiting for next poll
+        # Reflect the new priority on this select immediately instead of re-polling
+        # every WAN right away; a delayed refresh confirms what the router applied.
+        # Shared coordinator data is left alone: it is the baseline the next poll
+        # is compared against, and "Disabled" also changes the WAN's enabled state.
+        self._pending_option = option
+        self.async_write_ha_state()
+        if self._cancel_confirm is not None:
+            self._cancel_confirm()
+        self._cancel_confirm = async_call_later(
+            self.hass, CONFIRM_REFRESH_DELAY, self._async_confirm_refresh
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the optimistic option once real data arrives."""
+        self._pending_option = None
+        super()._handle_coordinator_update()
+
+    async def _async_confirm_refresh(self, _now: datetime) -> None:
+        """Re-poll after a priority change (debounced by the coordinator)."""
+        self._cancel_confirm = None
         await self.coordinator.async_request_refresh()
+        # An unchanged poll doesn't notify listeners (always_update=False), so make
+        # sure the optimistic option never outlives the confirmation
+        if self._pending_option is not None:
+            self._pending_option = None
+            self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any pending confirmation refresh."""
+        if self._cancel_confirm is not None:
+            self._cancel_confirm()
+            self._cancel_confirm = None
+        await super().async_will_remove_from_hass()
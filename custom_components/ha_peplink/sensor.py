@@ -8,8 +8,9 @@ HA generates entity_ids like:
 from __future__ import annotations
 
 import datetime
+import functools
+import json
 import logging
-import math
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
@@ -21,7 +22,7 @@ from homeassistant.const import (
     UnitOfSpeed,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
@@ -35,7 +36,7 @@ from .const import (
 )
 from .coordinator import PeplinkCoordinator
 from .entity import PeplinkEntity, PeplinkWanEntity
-from .models import WanConnection, WanUsage
+from .models import FanInfo, LocationInfo, SimSlotInfo, WanConnection, WanUsage
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,7 +52,7 @@ async def async_setup_entry(
 
     for conn_id, wan in coordinator.wan_connections.items():
         # Per-WAN sensors (all connection types)
-        entities += [
+        entities.extend((
             WanStatusSensor(coordinator, entry, conn_id),
             WanPrioritySensor(coordinator, entry, conn_id),
             WanIpSensor(coordinator, entry, conn_id),
@@ -59,66 +60,72 @@ async def async_setup_entry(
             WanStatusLedSensor(coordinator, entry, conn_id),
             WanDownloadRateSensor(coordinator, entry, conn_id),
             WanUploadRateSensor(coordinator, entry, conn_id),
-        ]
+        ))
 
         # Usage sensor — one per WAN for non-multi-SIM, or per-SIM for cellular multi-SIM
         if wan.sim_slot_count > 1:
             for slot_id in range(1, wan.sim_slot_count + 1):
-                entities.append(SimUsageSensor(coordinator, entry, conn_id, slot_id))
-                entities.append(SimUsagePercentSensor(coordinator, entry, conn_id, slot_id))
+                entities.extend((
+                    SimUsageSensor(coordinator, entry, conn_id, slot_id),
+                    SimUsagePercentSensor(coordinator, entry, conn_id, slot_id),
+                ))
         else:
-            entities.append(WanUsageSensor(coordinator, entry, conn_id))
-            entities.append(WanUsagePercentSensor(coordinator, entry, conn_id))
-
-        # Cellular-specific sensors
-        if wan.wan_type == WAN_TYPE_CELLULAR:
-            entities += [
-                WanSignalSensor(coordinator, entry, conn_id),
-                WanSignalDbmSensor(coordinator, entry, conn_id),
-                WanCarrierSensor(coordinator, entry, conn_id),
-                WanNetworkSensor(coordinator, entry, conn_id),
-                WanBandsSensor(coordinator, entry, conn_id),
-            ]
+            entities.extend((
+                WanUsageSensor(coordinator, entry, conn_id),
+                WanUsagePercentSensor(coordinator, entry, conn_id),
+            ))
+
+    # Cellular-specific sensors
+    for conn_id in coordinator.wan_by_type.get(WAN_TYPE_CELLULAR, ()):
+        entities.extend((
+            WanSignalSensor(coordinator, entry, conn_id),
+            WanSignalDbmSensor(coordinator, entry, conn_id),
+            WanCarrierSensor(coordinator, entry, conn_id),
+            WanNetworkSensor(coordinator, entry, conn_id),
+            WanBandsSensor(coordinator, entry, conn_id),
+        ))
 
     # Global diagnostic sensors
-    entities += [
+    entities.extend((
         FirmwareVersionSensor(coordinator, entry),
         ConnectedDevicesSensor(coordinator, entry),
         SystemTemperatureSensor(coordinator, entry),
         TemperatureThresholdSensor(coordinator, entry),
         SerialNumberSensor(coordinator, entry),
         ModelSensor(coordinator, entry),
-    ]
+    ))
     for fan_id in range(1, 4):  # Fans 1-3 (match plugin: "Add up to 3 fans")
-        entities += [
+        entities.extend((
             FanSpeedSensor(coordinator, entry, fan_id),
             FanStatusSensor(coordinator, entry, fan_id),
-        ]
+        ))
 
     # SpeedFusion Connect sensors — only on devices with an active SFC profile.
     # (Requires admin credentials for the web-admin session; reconfiguring the
     # entry to add them reloads it, re-running this gate.)
     sfc = coordinator.data.sfc if coordinator.data is not None else None
     if sfc is not None and sfc.has_profile:
-        entities += [
+        entities.extend((
             SfcDataAllowanceSensor(coordinator, entry),
             SfcRenewalDateSensor(coordinator, entry),
-        ]
+        ))
 
     # VPN sensors (when enabled; profiles discovered at setup)
-    if entry.options.get(CONF_ENABLE_VPN, False):
-        for profile in coordinator.vpn_profiles_at_discovery.values():
-            entities.append(VpnStatusSensor(coordinator, entry, profile.profile_id, profile.name))
+    if coordinator.options[CONF_ENABLE_VPN]:
+        entities.extend(
+            VpnStatusSensor(coordinator, entry, profile.profile_id, profile.name)
+            for profile in coordinator.vpn_profiles_at_discovery.values()
+        )
 
     # GPS sensors (when enabled)
-    if entry.options.get(CONF_ENABLE_GPS, False):
-        entities += [
+    if coordinator.options[CONF_ENABLE_GPS]:
+        entities.extend((
             GpsSpeedSensor(coordinator, entry),
             GpsAltitudeSensor(coordinator, entry),
             GpsHeadingSensor(coordinator, entry),
             GpsLatitudeSensor(coordinator, entry),
             GpsLongitudeSensor(coordinator, entry),
-        ]
+        ))
 
     async_add_entities(entities)
 
@@ -152,12 +159,15 @@ def _resolve_signal_dbm(cellular) -> int | None:
     return cellular.rsrp_dbm or cellular.rssi_dbm
 
 
+@functools.lru_cache(maxsize=64)
 def _parse_carrier_name(carrier: str | None) -> str:
-    """Parse carrier JSON if present, else return raw string. Port of parseCarrierName()."""
+    """Parse carrier JSON if present, else return raw string. Port of parseCarrierName().
+
+    Memoized: carrier strings are few (one per SIM) and rarely change between polls.
+    """
     if not carrier:
         return ""
     try:
-        import json
         obj = json.loads(carrier)
         if isinstance(obj, dict):
             return obj.get("name", carrier)
@@ -166,6 +176,13 @@ def _parse_carrier_name(carrier: str | None) -> str:
     return carrier
 
 
+def _find_fan(data, fan_id: int) -> FanInfo | None:
+    """Fan fan_id from the latest diagnostics, or None if absent."""
+    if data is None or data.diagnostics is None:
+        return None
+    return data.diagnostics.fans_by_id.get(fan_id)
+
+
 def _format_usage_gb(mb: int | None) -> str:
     """Format MB value as '0.00 GB'. Port of formatUsageGb()."""
     if mb is None:
@@ -180,14 +197,18 @@ def _compute_usage_percent(usage_mb: int | None, limit_mb: int | None) -> int |
     return round((usage_mb / limit_mb) * 100)
 
 
+# Billing start days are 1-31, so every ordinal we can show is known up front
+_ORDINAL_DAYS = tuple(
+    f"{day}{'th' if 11 <= day <= 13 else {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')}"
+    for day in range(1, 32)
+)
+
+
 def _format_ordinal(day: int | None) -> str | None:
     """Format day as ordinal ('1st', '2nd', etc.). Port of formatOrdinalDay()."""
-    if day is None:
+    if day is None or not 1 <= day <= 31:
         return None
-    if 11 <= day <= 13:
-        return f"{day}th"
-    suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
-    return f"{day}{suffix}"
+    return _ORDINAL_DAYS[day - 1]
 
 
 def _parse_start_day(start: str | None) -> int | None:
@@ -201,8 +222,8 @@ def _parse_start_day(start: str | None) -> int | None:
         return None
 
 
-def _usage_attributes(usage: WanUsage | None) -> dict[str, Any]:
-    """Build extra_state_attributes for a usage sensor. Port of MQTT usage_attributes JSON."""
+def _usage_attributes(usage: WanUsage | SimSlotInfo | None) -> dict[str, Any]:
+    """Build extra_state_attributes for a WAN or SIM slot usage sensor. Port of MQTT usage_attributes JSON."""
     if usage is None:
         return {}
     percent = usage.percent or _compute_usage_percent(usage.usage_mb, usage.limit_mb) or 0
@@ -220,15 +241,9 @@ def _usage_attributes(usage: WanUsage | None) -> dict[str, Any]:
 class WanStatusSensor(PeplinkWanEntity, SensorEntity):
     """Raw WAN status message. Name: '{wan.name} Status'."""
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_status"
-        self._attr_icon = "mdi:lan"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Status" if wan else f"WAN {self._conn_id} Status"
+    _SUFFIX = "status"
+    _NAME_SUFFIX = "Status"
+    _attr_icon = "mdi:lan"
 
     @property
     def native_value(self) -> str | None:
@@ -241,15 +256,9 @@ class WanStatusSensor(PeplinkWanEntity, SensorEntity):
 class WanPrioritySensor(PeplinkWanEntity, SensorEntity):
     """WAN priority level (1-4) or empty string if disabled. Name: '{wan.name} Priority'."""
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_priority"
-        self._attr_icon = "mdi:sort-numeric-ascending"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Priority" if wan else f"WAN {self._conn_id} Priority"
+    _SUFFIX = "priority"
+    _NAME_SUFFIX = "Priority"
+    _attr_icon = "mdi:sort-numeric-ascending"
 
     @property
     def native_value(self) -> str | None:
@@ -262,15 +271,9 @@ class WanPrioritySensor(PeplinkWanEntity, SensorEntity):
 class WanIpSensor(PeplinkWanEntity, SensorEntity):
     """WAN assigned IP address. Name: '{wan.name} IP'."""
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_ip"
-        self._attr_icon = "mdi:ip-network"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} IP" if wan else f"WAN {self._conn_id} IP"
+    _SUFFIX = "ip"
+    _NAME_SUFFIX = "IP"
+    _attr_icon = "mdi:ip-network"
 
     @property
     def native_value(self) -> str | None:
@@ -281,15 +284,9 @@ class WanIpSensor(PeplinkWanEntity, SensorEntity):
 class WanUptimeSensor(PeplinkWanEntity, SensorEntity):
     """WAN connection uptime formatted as D:HH:MM. Name: '{wan.name} Uptime'."""
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_uptime"
-        self._attr_icon = "mdi:clock-outline"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Uptime" if wan else f"WAN {self._conn_id} Uptime"
+    _SUFFIX = "uptime"
+    _NAME_SUFFIX = "Uptime"
+    _attr_icon = "mdi:clock-outline"
 
     @property
     def native_value(self) -> str | None:
@@ -302,15 +299,9 @@ class WanUptimeSensor(PeplinkWanEntity, SensorEntity):
 class WanStatusLedSensor(PeplinkWanEntity, SensorEntity):
     """WAN LED status indicator color. Name: '{wan.name} Status LED'."""
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_status_led"
-        self._attr_icon = "mdi:led-outline"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Status LED" if wan else f"WAN {self._conn_id} Status LED"
+    _SUFFIX = "status_led"
+    _NAME_SUFFIX = "Status LED"
+    _attr_icon = "mdi:led-outline"
 
     @property
     def native_value(self) -> str | None:
@@ -321,47 +312,33 @@ class WanStatusLedSensor(PeplinkWanEntity, SensorEntity):
 class WanDownloadRateSensor(PeplinkWanEntity, SensorEntity):
     """WAN download bandwidth in Mbit/s. Name: '{wan.name} Download Rate'."""
 
+    _SUFFIX = "download_rate"
+    _NAME_SUFFIX = "Download Rate"
     _attr_device_class = SensorDeviceClass.DATA_RATE
     _attr_native_unit_of_measurement = UnitOfDataRate.MEGABITS_PER_SECOND
     _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_download_rate"
-        self._attr_icon = "mdi:download"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Download Rate" if wan else f"WAN {self._conn_id} Download Rate"
+    _attr_icon = "mdi:download"
 
     @property
     def native_value(self) -> float | None:
         wan = self._wan
-        return round(wan.download_rate_mbps, 1) if wan and wan.download_rate_mbps is not None else None
+        return wan.download_rate_mbps if wan else None
 
 
 class WanUploadRateSensor(PeplinkWanEntity, SensorEntity):
     """WAN upload bandwidth in Mbit/s. Name: '{wan.name} Upload Rate'."""
 
+    _SUFFIX = "upload_rate"
+    _NAME_SUFFIX = "Upload Rate"
     _attr_device_class = SensorDeviceClass.DATA_RATE
     _attr_native_unit_of_measurement = UnitOfDataRate.MEGABITS_PER_SECOND
     _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_upload_rate"
-        self._attr_icon = "mdi:upload"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Upload Rate" if wan else f"WAN {self._conn_id} Upload Rate"
+    _attr_icon = "mdi:upload"
 
     @property
     def native_value(self) -> float | None:
         wan = self._wan
-        return round(wan.upload_rate_mbps, 1) if wan and wan.upload_rate_mbps is not None else None
+        return wan.upload_rate_mbps if wan else None
 
 
 class WanUsageSensor(PeplinkWanEntity, SensorEntity):
@@ -371,31 +348,35 @@ class WanUsageSensor(PeplinkWanEntity, SensorEntity):
     State: 'Enabled' or 'Disabled'. Attributes carry usage/allowance/percent/start_day.
     """
 
+    _SUFFIX = "usage"
+    _attr_icon = "mdi:gauge"
+
     def __init__(self, coordinator, entry, conn_id):
         super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_usage"
-        self._attr_icon = "mdi:gauge"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return wan.name if wan else f"WAN {self._conn_id}"
+        self._attr_name = self._wan_name
+        self._attrs_cached: dict[str, Any] = {}
+        self._attrs_version = -1
 
     @property
     def native_value(self) -> str | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        usage = self.coordinator.data.wan_usage.get(self._conn_id)
+        usage = data.wan_usage.get(self._conn_id)
         if usage is None:
             return None
         return "Enabled" if usage.enabled else "Disabled"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        if self.coordinator.data is None:
-            return {}
-        usage = self.coordinator.data.wan_usage.get(self._conn_id)
-        return _usage_attributes(usage)
+        # Rebuilt once per coordinator update, like _wan
+        version = self.coordinator.data_version
+        if version != self._attrs_version:
+            data = self.coordinator.data
+            usage = data.wan_usage.get(self._conn_id) if data is not None else None
+            self._attrs_cached = _usage_attributes(usage)
+            self._attrs_version = version
+        return self._attrs_cached
 
 
 class SimUsageSensor(PeplinkWanEntity, SensorEntity):
@@ -405,25 +386,23 @@ class SimUsageSensor(PeplinkWanEntity, SensorEntity):
     State: 'Enabled' or 'Disabled'. Attributes carry usage/allowance/percent/start_day.
     """
 
+    _attr_icon = "mdi:sim"
+
     def __init__(self, coordinator, entry, conn_id, slot_id: int):
         super().__init__(coordinator, entry, conn_id)
         self._slot_id = slot_id
-        slot_name = SIM_SLOT_NAMES.get(slot_id, f"SIM {slot_id}")
+        self._slot_name = SIM_SLOT_NAMES.get(slot_id) or f"SIM {slot_id}"
         self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_sim{slot_id}_usage"
-        self._attr_icon = "mdi:sim"
-        self._slot_name = slot_name
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        base = wan.name if wan else f"WAN {self._conn_id}"
-        return f"{base} {self._slot_name}"
+        self._attr_name = f"{self._wan_name} {self._slot_name}"
+        self._attrs_cached: dict[str, Any] = {}
+        self._attrs_version = -1
 
     @property
     def native_value(self) -> str | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        usage = self.coordinator.data.wan_usage.get(self._conn_id)
+        usage = data.wan_usage.get(self._conn_id)
         if usage is None or usage.sim_slots is None:
             return "Disabled"
         slot = usage.sim_slots.get(self._slot_id)
@@ -433,22 +412,24 @@ class SimUsageSensor(PeplinkWanEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        if self.coordinator.data is None:
+        # Rebuilt once per coordinator update, like _wan
+        version = self.coordinator.data_version
+        if version != self._attrs_version:
+            self._attrs_cached = self._build_attributes()
+            self._attrs_version = version
+        return self._attrs_cached
+
+    def _build_attributes(self) -> dict[str, Any]:
+        data = self.coordinator.data
+        if data is None:
             return {}
-        usage = self.coordinator.data.wan_usage.get(self._conn_id)
+        usage = data.wan_usage.get(self._conn_id)
         if usage is None or usage.sim_slots is None:
             return {}
         slot = usage.sim_slots.get(self._slot_id)
         if slot is None or not slot.enabled or not slot.has_usage_tracking:
             return {}
-        percent = slot.percent or _compute_usage_percent(slot.usage_mb, slot.limit_mb) or 0
-        start = _format_ordinal(_parse_start_day(slot.start_date)) or "unknown"
-        return {
-            "usage": _format_usage_gb(slot.usage_mb),
-            "allowance": _format_usage_gb(slot.limit_mb) if slot.limit_mb else "unlimited",
-            "percent_used": percent,
-            "start_day": start,
-        }
+        return _usage_attributes(slot)
 
 
 class WanUsagePercentSensor(PeplinkWanEntity, SensorEntity):
@@ -457,24 +438,18 @@ class WanUsagePercentSensor(PeplinkWanEntity, SensorEntity):
     Name: '{wan.name} Usage Percent'.
     """
 
+    _SUFFIX = "usage_percent"
+    _NAME_SUFFIX = "Usage Percent"
     _attr_native_unit_of_measurement = "%"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:percent"
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_usage_percent"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Usage Percent" if wan else f"WAN {self._conn_id} Usage Percent"
-
     @property
     def native_value(self) -> int | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        usage = self.coordinator.data.wan_usage.get(self._conn_id)
+        usage = data.wan_usage.get(self._conn_id)
         if usage is None:
             return None
         return usage.percent or _compute_usage_percent(usage.usage_mb, usage.limit_mb)
@@ -493,20 +468,16 @@ class SimUsagePercentSensor(PeplinkWanEntity, SensorEntity):
     def __init__(self, coordinator, entry, conn_id, slot_id: int):
         super().__init__(coordinator, entry, conn_id)
         self._slot_id = slot_id
-        self._slot_name = SIM_SLOT_NAMES.get(slot_id, f"SIM {slot_id}")
+        self._slot_name = SIM_SLOT_NAMES.get(slot_id) or f"SIM {slot_id}"
         self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_sim{slot_id}_usage_percent"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        base = wan.name if wan else f"WAN {self._conn_id}"
-        return f"{base} {self._slot_name} Usage Percent"
+        self._attr_name = f"{self._wan_name} {self._slot_name} Usage Percent"
 
     @property
     def native_value(self) -> int | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        usage = self.coordinator.data.wan_usage.get(self._conn_id)
+        usage = data.wan_usage.get(self._conn_id)
         if usage is None or usage.sim_slots is None:
             return None
         slot = usage.sim_slots.get(self._slot_id)
@@ -520,15 +491,9 @@ class SimUsagePercentSensor(PeplinkWanEntity, SensorEntity):
 class WanSignalSensor(PeplinkWanEntity, SensorEntity):
     """Formatted signal ('X/5' or 'X dBm'). Name: '{wan.name} Signal'."""
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_signal"
-        self._attr_icon = "mdi:signal-cellular-3"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Signal" if wan else f"WAN {self._conn_id} Signal"
+    _SUFFIX = "signal"
+    _NAME_SUFFIX = "Signal"
+    _attr_icon = "mdi:signal-cellular-3"
 
     @property
     def native_value(self) -> str | None:
@@ -541,19 +506,12 @@ class WanSignalSensor(PeplinkWanEntity, SensorEntity):
 class WanSignalDbmSensor(PeplinkWanEntity, SensorEntity):
     """Raw signal in dBm. Name: '{wan.name} Signal dBm'."""
 
+    _SUFFIX = "signal_dbm"
+    _NAME_SUFFIX = "Signal dBm"
     _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
     _attr_native_unit_of_measurement = "dBm"
     _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_signal_dbm"
-        self._attr_icon = "mdi:signal"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Signal dBm" if wan else f"WAN {self._conn_id} Signal dBm"
+    _attr_icon = "mdi:signal"
 
     @property
     def native_value(self) -> int | None:
@@ -566,15 +524,9 @@ class WanSignalDbmSensor(PeplinkWanEntity, SensorEntity):
 class WanCarrierSensor(PeplinkWanEntity, SensorEntity):
     """Cellular carrier name. Name: '{wan.name} Carrier'."""
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_carrier"
-        self._attr_icon = "mdi:sim"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Carrier" if wan else f"WAN {self._conn_id} Carrier"
+    _SUFFIX = "carrier"
+    _NAME_SUFFIX = "Carrier"
+    _attr_icon = "mdi:sim"
 
     @property
     def native_value(self) -> str | None:
@@ -587,15 +539,9 @@ class WanCarrierSensor(PeplinkWanEntity, SensorEntity):
 class WanNetworkSensor(PeplinkWanEntity, SensorEntity):
     """Network type (LTE, 5G, etc.). Name: '{wan.name} Network'."""
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_network"
-        self._attr_icon = "mdi:network"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Network" if wan else f"WAN {self._conn_id} Network"
+    _SUFFIX = "network"
+    _NAME_SUFFIX = "Network"
+    _attr_icon = "mdi:network"
 
     @property
     def native_value(self) -> str | None:
@@ -608,15 +554,9 @@ class WanNetworkSensor(PeplinkWanEntity, SensorEntity):
 class WanBandsSensor(PeplinkWanEntity, SensorEntity):
     """Active cellular bands joined as comma-separated string. Name: '{wan.name} Bands'."""
 
-    def __init__(self, coordinator, entry, conn_id):
-        super().__init__(coordinator, entry, conn_id)
-        self._attr_unique_id = f"{entry.entry_id}_wan{conn_id}_bands"
-        self._attr_icon = "mdi:radio-tower"
-
-    @property
-    def name(self) -> str:
-        wan = self.coordinator.wan_connections.get(self._conn_id)
-        return f"{wan.name} Bands" if wan else f"WAN {self._conn_id} Bands"
+    _SUFFIX = "bands"
+    _NAME_SUFFIX = "Bands"
+    _attr_icon = "mdi:radio-tower"
 
     @property
     def native_value(self) -> str | None:
@@ -642,9 +582,10 @@ class FirmwareVersionSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.firmware_version
+        return data.firmware_version
 
 
 class ConnectedDevicesSensor(PeplinkEntity, SensorEntity):
@@ -661,9 +602,10 @@ class ConnectedDevicesSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> int | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.connected_devices
+        return data.connected_devices
 
 
 class SystemTemperatureSensor(PeplinkEntity, SensorEntity):
@@ -683,10 +625,10 @@ class SystemTemperatureSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        if self.coordinator.data is None or self.coordinator.data.diagnostics is None:
+        data = self.coordinator.data
+        if data is None or data.diagnostics is None:
             return None
-        t = self.coordinator.data.diagnostics.temperature
-        return round(t, 1) if t is not None else None
+        return data.diagnostics.temperature
 
 
 class SfcDataAllowanceSensor(PeplinkEntity, SensorEntity):
@@ -708,7 +650,8 @@ class SfcDataAllowanceSensor(PeplinkEntity, SensorEntity):
 
     @property
     def _sfc(self):
-        return self.coordinator.data.sfc if self.coordinator.data is not None else None
+        data = self.coordinator.data
+        return data.sfc if data is not None else None
 
     @property
     def native_value(self) -> float | None:
@@ -743,7 +686,8 @@ class SfcRenewalDateSensor(PeplinkEntity, SensorEntity):
 
     @property
     def _sfc(self):
-        return self.coordinator.data.sfc if self.coordinator.data is not None else None
+        data = self.coordinator.data
+        return data.sfc if data is not None else None
 
     @property
     def native_value(self) -> datetime.date | None:
@@ -785,10 +729,10 @@ class TemperatureThresholdSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        if self.coordinator.data is None or self.coordinator.data.diagnostics is None:
+        data = self.coordinator.data
+        if data is None or data.diagnostics is None:
             return None
-        t = self.coordinator.data.diagnostics.temperature_threshold
-        return round(t, 0) if t is not None else None
+        return data.diagnostics.temperature_threshold
 
 
 class FanSpeedSensor(PeplinkEntity, SensorEntity):
@@ -808,23 +752,12 @@ class FanSpeedSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> int | None:
-        if self.coordinator.data is None or self.coordinator.data.diagnostics is None:
-            return None
-        for fan in self.coordinator.data.diagnostics.fans:
-            if fan.fan_id == self._fan_id:
-                return fan.speed_rpm
-        return None
+        fan = _find_fan(self.coordinator.data, self._fan_id)
+        return fan.speed_rpm if fan is not None else None
 
     @property
     def available(self) -> bool:
-        if not super().available:
-            return False
-        if self.coordinator.data is None or self.coordinator.data.diagnostics is None:
-            return False
-        return any(
-            f.fan_id == self._fan_id
-            for f in self.coordinator.data.diagnostics.fans
-        )
+        return super().available and _find_fan(self.coordinator.data, self._fan_id) is not None
 
 
 class FanStatusSensor(PeplinkEntity, SensorEntity):
@@ -842,23 +775,12 @@ class FanStatusSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        if self.coordinator.data is None or self.coordinator.data.diagnostics is None:
-            return None
-        for fan in self.coordinator.data.diagnostics.fans:
-            if fan.fan_id == self._fan_id:
-                return fan.status
-        return None
+        fan = _find_fan(self.coordinator.data, self._fan_id)
+        return fan.status if fan is not None else None
 
     @property
     def available(self) -> bool:
-        if not super().available:
-            return False
-        if self.coordinator.data is None or self.coordinator.data.diagnostics is None:
-            return False
-        return any(
-            f.fan_id == self._fan_id
-            for f in self.coordinator.data.diagnostics.fans
-        )
+        return super().available and _find_fan(self.coordinator.data, self._fan_id) is not None
 
 
 class SerialNumberSensor(PeplinkEntity, SensorEntity):
@@ -874,9 +796,10 @@ class SerialNumberSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        if self.coordinator.data is None or self.coordinator.data.device_info is None:
+        data = self.coordinator.data
+        if data is None or data.device_info is None:
             return None
-        sn = self.coordinator.data.device_info.serial_number
+        sn = data.device_info.serial_number
         return sn if sn and sn != "unknown" else None
 
 
@@ -893,9 +816,10 @@ class ModelSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        if self.coordinator.data is None or self.coordinator.data.device_info is None:
+        data = self.coordinator.data
+        if data is None or data.device_info is None:
             return None
-        m = self.coordinator.data.device_info.model
+        m = data.device_info.model
         return m if m and m != "unknown" else None
 
 
@@ -915,15 +839,34 @@ class VpnStatusSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        profile = self.coordinator.data.vpn_profiles.get(self._profile_id)
+        profile = data.vpn_profiles.get(self._profile_id)
         return profile.status if profile else None
 
 
 # ===== GPS SENSORS =====
 
-class GpsSpeedSensor(PeplinkEntity, SensorEntity):
+class _GpsSensor(PeplinkEntity, SensorEntity):
+    """Base for GPS sensors; resolves the location once per coordinator update."""
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry)
+        self._location: LocationInfo | None = None
+        self._refresh_location()
+
+    def _refresh_location(self) -> None:
+        data = self.coordinator.data
+        self._location = data.location if data is not None else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._refresh_location()
+        super()._handle_coordinator_update()
+
+
+class GpsSpeedSensor(_GpsSensor):
     """GPS speed in m/s. Name: 'GPS Speed'."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -939,12 +882,11 @@ class GpsSpeedSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        if self.coordinator.data is None or self.coordinator.data.location is None:
-            return None
-        return self.coordinator.data.location.speed
+        loc = self._location
+        return loc.speed if loc is not None else None
 
 
-class GpsAltitudeSensor(PeplinkEntity, SensorEntity):
+class GpsAltitudeSensor(_GpsSensor):
     """GPS altitude in metres. Name: 'GPS Altitude'."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -960,12 +902,11 @@ class GpsAltitudeSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        if self.coordinator.data is None or self.coordinator.data.location is None:
-            return None
-        return self.coordinator.data.location.altitude
+        loc = self._location
+        return loc.altitude if loc is not None else None
 
 
-class GpsHeadingSensor(PeplinkEntity, SensorEntity):
+class GpsHeadingSensor(_GpsSensor):
     """GPS heading in degrees. Name: 'GPS Heading'."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -980,12 +921,11 @@ class GpsHeadingSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        if self.coordinator.data is None or self.coordinator.data.location is None:
-            return None
-        return self.coordinator.data.location.heading
+        loc = self._location
+        return loc.heading if loc is not None else None
 
 
-class GpsLatitudeSensor(PeplinkEntity, SensorEntity):
+class GpsLatitudeSensor(_GpsSensor):
     """GPS latitude in decimal degrees. Name: 'GPS Latitude'."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -1000,15 +940,13 @@ class GpsLatitudeSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        if self.coordinator.data is None or self.coordinator.data.location is None:
-            return None
-        loc = self.coordinator.data.location
-        if not loc.has_valid_fix:
+        loc = self._location
+        if loc is None or not loc.has_valid_fix:
             return None
         return round(loc.latitude, 6) if loc.latitude is not None else None
 
 
-class GpsLongitudeSensor(PeplinkEntity, SensorEntity):
+class GpsLongitudeSensor(_GpsSensor):
     """GPS longitude in decimal degrees. Name: 'GPS Longitude'."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -1023,9 +961,7 @@ class GpsLongitudeSensor(PeplinkEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        if self.coordinator.data is None or self.coordinator.data.location is None:
-            return None
-        loc = self.coordinator.data.location
-        if not loc.has_valid_fix:
+        loc = self._location
+        if loc is None or not loc.has_valid_fix:
             return None
         return round(loc.longitude, 6) if loc.longitude is not None else None